@@ -1,55 +1,170 @@
+import gzip
+import logging
+import os
+import sys
+from pathlib import Path
+
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from lxml import etree
+
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+log = logging.getLogger(__name__)
 
 url = "https://news.naver.com/section/105"  # IT/과학 섹션
 
 headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    # Compressed transfer; urllib3 adds "br" only when a brotli decoder is installed.
+    "Accept-Encoding": ACCEPT_ENCODING,
 }
 
-print(f"Fetching: {url}")
-r = requests.get(url, headers=headers, timeout=5)
-print(f"Status: {r.status_code}")
+def has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compile selectors once as XPath (same semantics as the original CSS selectors).
+ITEM_CONDITION = (
+    f"{has_class('sa_text')}"
+    f" or {has_class('cjs_news_tw')}"
+    f" or (self::li and ancestor::*[{has_class('list_body')}])"
+)
+TITLE_CONDITION = (
+    f"(self::strong and {has_class('sa_text_strong')})"
+    f" or {has_class('sa_text_title')}"
+    f" or (self::a and {has_class('sa_text_lede')})"
+)
+XP_ITEMS = etree.XPath(f"//*[{ITEM_CONDITION}]")
+# One descent per item: first title/link/img nodes come back together in document order.
+XP_ITEM_FIELDS = etree.XPath(
+    f"(.//*[{TITLE_CONDITION}])[1] | (.//a[@href])[1] | (.//img)[1]"
+)
+XP_IS_TITLE = etree.XPath(f"boolean({TITLE_CONDITION})")
+ITEM_MARKERS = (b"sa_text", b"cjs_news_tw", b"list_body")
+ALTERNATIVES = [
+    (".section_article", b"section_article"),
+    ("article", b"<article"),
+    (".news_area", b"news_area"),
+    ("ul.sa_list li", b"sa_list"),
+]
+
+
+def extract_item_fields(item: lxml.html.HtmlElement) -> tuple:
+    """Return (title, link, img) for one item, searched within that item only (like select_one)."""
+    title_elem = link_elem = img_elem = None
+    for node in XP_ITEM_FIELDS(item):
+        if title_elem is None and XP_IS_TITLE(node):
+            title_elem = node
+        if link_elem is None and node.tag == "a" and node.get("href") is not None:
+            link_elem = node
+        if img_elem is None and node.tag == "img":
+            img_elem = node
+    return title_elem, link_elem, img_elem
+
+
+def scan_alternatives(tree: lxml.html.HtmlElement | None, selectors: list[str]) -> dict[str, list]:
+    """Evaluate the fallback selectors in a single tree walk instead of one walk each."""
+    matches: dict[str, list] = {selector: [] for selector in selectors}
+    if tree is None or not selectors:
+        return matches
+    sa_list_depth = 0
+    for event, el in etree.iterwalk(tree, events=("start", "end")):
+        tag = el.tag
+        if not isinstance(tag, str):
+            continue
+        classes = el.get("class", "").split()
+        if event == "end":
+            if tag == "ul" and "sa_list" in classes:
+                sa_list_depth -= 1
+            continue
+        if "section_article" in classes and ".section_article" in matches:
+            matches[".section_article"].append(el)
+        if tag == "article" and "article" in matches:
+            matches["article"].append(el)
+        if "news_area" in classes and ".news_area" in matches:
+            matches[".news_area"].append(el)
+        if tag == "li" and sa_list_depth and "ul.sa_list li" in matches:
+            matches["ul.sa_list li"].append(el)
+        if tag == "ul" and "sa_list" in classes:
+            sa_list_depth += 1
+    return matches
+
 
-soup = BeautifulSoup(r.text, "html.parser")
+# Keep-alive session; 429/5xx responses are retried honoring the server's Retry-After.
+session = requests.Session()
+session.headers.update(headers)
+session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+        )
+    ),
+)
+
+# Offline replay for selector work: with NAVER_CACHE=1 the first fetch is saved and reused.
+cache_path = Path(os.getenv("NAVER_CACHE_PATH", "naver_raw.html.gz"))
+# Parsed like collect_news.get_bool_env, so NAVER_CACHE=0 keeps replay off.
+use_cache = os.getenv("NAVER_CACHE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+if use_cache and cache_path.exists():
+    log.info("Replaying cached page: %s", cache_path)
+    body = gzip.decompress(cache_path.read_bytes())
+else:
+    log.info("Fetching: %s", url)
+    r = session.get(url, timeout=5)
+    log.info("Status: %s", r.status_code)
+    body = r.content
+    if use_cache and r.status_code == 200:
+        cache_path.write_bytes(gzip.compress(body))
+
+# Byte-level prefilter: only build a DOM when a known list marker is present at all.
+has_item_markers = any(marker in body for marker in ITEM_MARKERS)
+present_alternatives = [selector for selector, marker in ALTERNATIVES if marker in body]
+tree = lxml.html.fromstring(body) if has_item_markers or present_alternatives else None
 
 # 뉴스 리스트 찾기
-news_items = soup.select(".sa_text, .cjs_news_tw, .list_body li")
-print(f"\nFound {len(news_items)} potential news items")
+news_items = XP_ITEMS(tree) if has_item_markers else []
+log.info("\nFound %d potential news items", len(news_items))
 
 if news_items:
-    print("\n=== First 3 items structure ===")
-    for i, item in enumerate(news_items[:3]):
-        print(f"\n--- Item {i+1} ---")
+    log.info("\n=== First 3 items structure ===")
+    # Column-wise (one list per field) extraction for the items we print.
+    shown = [(item, *extract_item_fields(item)) for item in news_items[:3]]
+    titles = [t.text_content().strip()[:50] if t is not None else None for _, t, _, _ in shown]
+    links = [a.get("href")[:80] if a is not None else None for _, _, a, _ in shown]
+    images = [(m.get("src") or m.get("data-src") or "N/A")[:80] if m is not None else None for _, _, _, m in shown]
+    classes = [item.get("class", "").split() for item, _, _, _ in shown]
+
+    for i, (title, link, image, item_classes) in enumerate(zip(titles, links, images, classes)):
+        log.info("\n--- Item %d ---", i + 1)
+
         # 제목 찾기
-        title_elem = item.select_one("strong.sa_text_strong, .sa_text_title, a.sa_text_lede")
-        if title_elem:
-            print(f"Title: {title_elem.get_text(strip=True)[:50]}")
-        
+        if title is not None:
+            log.info("Title: %s", title)
+
         # 링크 찾기
-        link_elem = item.select_one("a[href]")
-        if link_elem:
-            print(f"Link: {link_elem.get('href')[:80]}")
-        
+        if link is not None:
+            log.info("Link: %s", link)
+
         # 이미지 찾기
-        img_elem = item.select_one("img")
-        if img_elem:
-            print(f"Image: {img_elem.get('src', img_elem.get('data-src', 'N/A'))[:80]}")
-        
+        if image is not None:
+            log.info("Image: %s", image)
+
         # HTML 구조 확인
-        print(f"Classes: {item.get('class')}")
+        log.info("Classes: %s", item_classes)
 else:
-    print("\n=== Trying alternative selectors ===")
-    # 다른 선택자 시도
-    alternatives = [
-        ".section_article",
-        "article",
-        ".news_area",
-        "ul.sa_list li"
-    ]
-    for selector in alternatives:
-        items = soup.select(selector)
+    log.info("\n=== Trying alternative selectors ===")
+    # 다른 선택자 시도 (selectors whose marker is absent from the body are skipped)
+    matches = scan_alternatives(tree, present_alternatives)
+    for selector in present_alternatives:
+        items = matches[selector]
         if items:
-            print(f"Found {len(items)} items with selector: {selector}")
-            if items:
-                print(f"  First item classes: {items[0].get('class')}")
+            log.info("Found %d items with selector: %s", len(items), selector)
+            log.info("  First item classes: %s", items[0].get("class", "").split())
@@ -1,37 +1,97 @@
-import requests
-import json
+import logging
+import mmap
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+log = logging.getLogger(__name__)
+
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0 4472.124 Safari/537.36'
+})
+SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# Probe results are reused for a while; feed availability rarely changes minute-to-minute.
+CACHE_PATH = '.check_sources_cache.json'
+CACHE_TTL = int(os.getenv('CHECK_SOURCES_CACHE_TTL', '900'))
+
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'rb') as f:
+            cache = orjson.loads(f.read())
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    tmp_path = f"{CACHE_PATH}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(cache))
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError as e:
+        log.info("[WARN] Failed to write %s: %s", CACHE_PATH, e)
+
+
+CACHE = load_cache()
+
 
 def check_url(url, description):
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0 4472.124 Safari/537.36'
-    }
+    cached = CACHE.get(url)
+    if cached and time.time() - cached.get('ts', 0) < CACHE_TTL:
+        log.info("[%s] %s: %s (cached)", cached['status'], description, url)
+        return cached['status'] == 200
     try:
-        response = requests.get(url, headers=headers, timeout=5)
-        print(f"[{response.status_code}] {description}: {url}")
+        # Only the status code matters, so skip the body where the server allows it.
+        response = SESSION.head(url, timeout=5, allow_redirects=True)
+        if response.status_code in (405, 501):
+            response = SESSION.get(url, timeout=5, stream=True)
+            response.close()
+        log.info("[%s] %s: %s", response.status_code, description, url)
+        CACHE[url] = {'status': response.status_code, 'ts': time.time()}
         return response.status_code == 200
-    except Exception as e:
-        print(f"[ERR] {description}: {e}")
+    except requests.exceptions.RequestException as e:
+        log.info("[ERR] %s: %s", description, e)
         return False
 
-print("--- RSS/API URL Availability Check ---")
-check_url('https://hacker-news.firebaseio.com/v0/topstories.json', 'Hacker News API')
-check_url('https://openai.com/news/rss.xml', 'OpenAI Blog RSS (Variant 1)')
-check_url('https://openai.com/index.xml', 'OpenAI Blog RSS (Variant 2)')
-check_url('https://deepmind.google/blog/rss.xml', 'Google DeepMind Blog')
-check_url('https://research.google/blog/rss', 'Google Research Blog')
-check_url('https://www.microsoft.com/en-us/research/feed/', 'Microsoft Research Blog')
+TARGETS = [
+    ('https://hacker-news.firebaseio.com/v0/topstories.json', 'Hacker News API'),
+    ('https://openai.com/news/rss.xml', 'OpenAI Blog RSS (Variant 1)'),
+    ('https://openai.com/index.xml', 'OpenAI Blog RSS (Variant 2)'),
+    ('https://deepmind.google/blog/rss.xml', 'Google DeepMind Blog'),
+    ('https://research.google/blog/rss', 'Google Research Blog'),
+    ('https://www.microsoft.com/en-us/research/feed/', 'Microsoft Research Blog'),
+]
+
+log.info("--- RSS/API URL Availability Check ---")
+# Probes are independent, so run them concurrently; total time ~= slowest probe.
+with ThreadPoolExecutor(max_workers=len(TARGETS)) as executor:
+    list(executor.map(lambda target: check_url(*target), TARGETS))
+save_cache(CACHE)
 
-print("\n--- JSON Data File Check ---")
+log.info("\n--- JSON Data File Check ---")
 json_path = 'news_data.json'
 if os.path.exists(json_path):
     try:
-        with open(json_path, 'rt', encoding='utf-8') as f:
-            data = json.load(f)
-            print(f"news_data.json is valid. Contains {len(data)} items.")
-    except json.JSONDecodeError:
-        print("news_data.json is CORRUPTED (JSONDecodeError).")
+        with open(json_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise orjson.JSONDecodeError("empty file", "", 0)
+            # Hand the mapped pages straight to the parser; no read()/decode copy.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                data = orjson.loads(buf)
+            log.info("news_data.json is valid. Contains %d items.", len(data))
+    except orjson.JSONDecodeError:
+        log.info("news_data.json is CORRUPTED (JSONDecodeError).")
     except Exception as e:
-        print(f"Error reading news_data.json: {e}")
+        log.info("Error reading news_data.json: %s", e)
 else:
-    print("news_data.json does not exist.")
+    log.info("news_data.json does not exist.")
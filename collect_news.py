@@ -1,25 +1,39 @@
+import atexit
 import base64
+import functools
 import hashlib
 import html
 import json
 import os
 import random
 import re
+import sqlite3
 import sys
-import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from urllib.parse import quote_plus, urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+from news_js_writer import dumps_news_json, gzip_copy_enabled, write_news_js_payload
+
 try:
     import google.generativeai as genai
 except Exception:
     genai = None
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 load_dotenv()
 
 
@@ -33,8 +47,8 @@ def get_int_env(name: str, default: int) -> int:
         return default
 
 
-def get_csv_env_set(name: str) -> set[str]:
-    return {part.strip().lower() for part in os.getenv(name, "").split(",") if part.strip()}
+def get_csv_env_set(name: str) -> frozenset[str]:
+    return frozenset(part.strip().lower() for part in os.getenv(name, "").split(",") if part.strip())
 
 
 def get_bool_env(name: str, default: bool) -> bool:
@@ -51,6 +65,28 @@ REQUEST_HEADERS = {
         "Chrome/120.0.0.0 Safari/537.36"
     )
 }
+
+
+def build_http_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    # Transient 429/5xx on idempotent requests are retried; POSTs to Gemini are never replayed.
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared keep-alive pool: feeds and image CDNs reuse TCP/TLS connections across fetches.
+_http_session = build_http_session()
+atexit.register(_http_session.close)
+
 IMAGE_OUTPUT_DIR = Path(os.getenv("NEWS_IMAGE_DIR", "generated_images"))
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "").strip()
 GEMINI_PROMPT_MODEL = os.getenv("GEMINI_PROMPT_MODEL", "gemini-2.5-flash")
@@ -69,20 +105,40 @@ KEYWORD_PHOTO_ENABLED = get_bool_env("KEYWORD_PHOTO_ENABLED", True)
 KEYWORD_STOCK_ENABLED = get_bool_env("KEYWORD_STOCK_ENABLED", True)
 KEYWORD_STOCK_TIMEOUT = get_int_env("KEYWORD_STOCK_TIMEOUT", 20)
 MIN_STOCK_IMAGE_BYTES = get_int_env("MIN_STOCK_IMAGE_BYTES", 1500)
+MAX_STOCK_IMAGE_BYTES = get_int_env("MAX_STOCK_IMAGE_BYTES", 5 * 1024 * 1024)
 KEYWORD_REPRESENTATIVE_QUERY_ENABLED = get_bool_env("KEYWORD_REPRESENTATIVE_QUERY_ENABLED", True)
 IMAGE_DEDUP_IN_RUN = get_bool_env("IMAGE_DEDUP_IN_RUN", True)
+IMAGE_DEDUP_ACROSS_RUNS = get_bool_env("IMAGE_DEDUP_ACROSS_RUNS", False)
+IMAGE_DEDUP_DB_PATH = IMAGE_OUTPUT_DIR / ".dedup.sqlite"
 COMPANY_LOGO_PRIORITY_MODE = get_bool_env("COMPANY_LOGO_PRIORITY_MODE", True)
 USE_RSS_SOURCE_IMAGE = get_bool_env("USE_RSS_SOURCE_IMAGE", True)
 COMPANY_VARIANT_COUNT = max(1, min(5, get_int_env("COMPANY_VARIANT_COUNT", 5)))
 COMPANY_LOCAL_IMAGE_MODE = get_bool_env("COMPANY_LOCAL_IMAGE_MODE", True)
 COMPANY_IMAGE_POOL_DIR = Path(os.getenv("COMPANY_IMAGE_POOL_DIR", "company_images"))
+POOL_IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".svg", ".gif", ".ico"})
+COMPANY_CACHE_PERSIST = get_bool_env("COMPANY_CACHE_PERSIST", True)
+COMPANY_CACHE_DIR = Path(os.getenv("COMPANY_CACHE_DIR", "cache"))
+COMPANY_LOGO_FILE_MIME = {".png": "image/png", ".ico": "image/x-icon", ".svg": "image/svg+xml"}
 COMPANY_SEARCH_IMAGE_ENABLED = get_bool_env("COMPANY_SEARCH_IMAGE_ENABLED", True)
 COMPANY_SEARCH_IMAGE_TARGET = max(3, min(20, get_int_env("COMPANY_SEARCH_IMAGE_TARGET", 10)))
 COMPANY_SEARCH_TIMEOUT = get_int_env("COMPANY_SEARCH_TIMEOUT", 12)
 COMPANY_DAILY_ROTATION = get_bool_env("COMPANY_DAILY_ROTATION", True)
 COMPANY_INFER_FROM_ENGLISH_TITLE = get_bool_env("COMPANY_INFER_FROM_ENGLISH_TITLE", False)
+RSS_FETCH_WORKERS = max(1, get_int_env("RSS_FETCH_WORKERS", 8))
+IMAGE_FETCH_WORKERS = max(1, get_int_env("IMAGE_FETCH_WORKERS", 8))
+HN_FETCH_WORKERS = max(1, get_int_env("HN_FETCH_WORKERS", 10))
+# Stock candidates downloaded together per article; kept small to stay polite to the photo CDNs.
+STOCK_FETCH_WINDOW = 3
+# 0/1 keeps parsing in-process; larger values parse fetched feeds in that many worker processes.
+RSS_PARSE_PROCESSES = get_int_env("RSS_PARSE_PROCESSES", 0)
 NEWS_CURATION_ENABLED = get_bool_env("NEWS_CURATION_ENABLED", True)
 NEWS_CURATION_LIMIT = get_int_env("NEWS_CURATION_LIMIT", 20)
+# Curated summaries are reused across runs for the same article; entries expire with main()'s 7-day window.
+CURATION_CACHE_ENABLED = get_bool_env("CURATION_CACHE_ENABLED", True)
+CURATION_CACHE_PATH = COMPANY_CACHE_DIR / "curation.json"
+CURATION_CACHE_TTL_SECONDS = 7 * 24 * 3600
+# Articles sent per Gemini curation request; 1 keeps the one-call-per-article behaviour.
+CURATION_BATCH_SIZE = max(1, get_int_env("CURATION_BATCH_SIZE", 10))
 RSS_IMAGE_FORCE_ALLOW_SOURCES = get_csv_env_set("RSS_IMAGE_FORCE_ALLOW_SOURCES")
 RSS_IMAGE_FORCE_DENY_SOURCES = get_csv_env_set("RSS_IMAGE_FORCE_DENY_SOURCES")
 
@@ -90,13 +146,69 @@ _ai_image_count = 0
 _curation_count = 0
 _gemini_text_model_name = ""
 _gemini_text_model = None
-_used_image_hashes_in_run: set[str] = set()
+_latest_gemini_model: str | None = None
+_used_image_hashes_in_run: set[bytes] = set()
 _used_remote_image_urls_in_run: set[str] = set()
+_image_dedup_db: sqlite3.Connection | None = None
+# Earlier runs' claims, keyed to the article that made them (IMAGE_DEDUP_ACROSS_RUNS).
+_earlier_image_hash_owners: dict[bytes, str] = {}
+_earlier_remote_image_url_owners: dict[str, str] = {}
 _company_logo_data_uri_cache: dict[str, str] = {}
 _company_variant_paths_cache: dict[str, list[str]] = {}
 _company_variant_source_cache: dict[str, str] = {}
 _company_last_variant_index: dict[str, int] = {}
-_company_catalog_cache: list[dict] | None = None
+_gemini_prompt_cache: dict[bytes, str] = {}
+_curation_cache: dict[str, dict] | None = None
+_file_digest_cache: dict[str, tuple[int, int, bytes]] = {}
+_rendered_svg_stems: set[str] = set()
+# Visual variant picks need no crypto-grade randomness; seed once instead of a getrandom() per call.
+_variant_rng = random.Random(os.urandom(8))
+
+_SLUG_RE = re.compile(r"[^0-9A-Za-z]+")
+_WS_RE = re.compile(r"\s+")
+_CDATA_OPEN = "<![CDATA["
+_CDATA_CLOSE = "]]>"
+_VARIANT_SEQ_TAIL_RE = re.compile(r"(?:^|[-_])v?(\d+)$")
+_VARIANT_SEQ_RE = re.compile(r"(?:^|[-_])v?(\d+)(?:[-_].*)?$")
+_ASCII_ALIAS_RE = re.compile(r"[a-z0-9 .+\-&]+")
+_TITLE_TOKEN_RE = re.compile(r"\b[A-Z][A-Za-z0-9&.+-]{2,24}\b")
+_KEYWORD_ASCII_RE = re.compile(r"[^a-z0-9]+")
+_WORD_TOKEN_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9]{2,}")
+_TITLE_TOKEN_IGNORE = frozenset(
+    {
+        "The",
+        "This",
+        "That",
+        "Why",
+        "How",
+        "What",
+        "When",
+        "Where",
+        "Who",
+        "Its",
+        "Their",
+        "US",
+        "UK",
+        "EU",
+        "AI",
+        "IT",
+        "CEO",
+        "CFO",
+        "CTO",
+        "RSS",
+    }
+)
+_NOISY_QUERY_TERMS = frozenset({"the", "and", "for", "with", "from", "news", "tech", "today"})
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+_IMG_SRC_RE = re.compile(r"""(?<![\w-])src\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.IGNORECASE)
+_CDATA_SECTION_RE = re.compile(r"<!\[CDATA\[.*?\]\]>", re.DOTALL)
+_IMAGE_ALLOW_RE = re.compile(
+    r"creative commons|creativecommons\.org/licenses|cc[- ]by|public domain"
+    r"|(?:reuse|redistribution|republish) permitted"
+)
+_IMAGE_DENY_RE = re.compile(
+    r"all rights reserved|do not reproduce|no redistribution|unauthorized reproduction prohibited"
+)
 
 # Korean keys/values kept as Unicode escapes to avoid terminal encoding issues.
 KEY_COUNTRY = "\uad6d\uac00"
@@ -112,6 +224,8 @@ KEY_IMAGE_PROVIDER = "\uc774\ubbf8\uc9c0\uc0dd\uc131\ubc29\uc2dd"
 VAL_DOMESTIC = "\uad6d\ub0b4"
 VAL_US = "\ubbf8\uad6d"
 VAL_NAVER_NEWS = "\ub124\uc774\ubc84 \ub274\uc2a4"
+SORT_PRIORITY_KEY = "_sort_priority"
+NAVER_NEWS_BASE = "https://news.naver.com"
 
 KEYWORD_THEMES = [
     {
@@ -624,6 +738,50 @@ KEYWORD_THEME_SEARCH_QUERIES = {
     ],
 }
 
+
+
+def freeze_theme_terms(themes: list[dict], terms_key: str):
+    # Normalize once at import: lowercased term sets, immutable query/tag sequences.
+    for theme in themes:
+        theme[terms_key] = frozenset(
+            term.strip().lower() for term in theme.get(terms_key, []) if term and term.strip()
+        )
+        for seq_key in ("search_queries", "stock_tags"):
+            if seq_key in theme:
+                theme[seq_key] = tuple(theme[seq_key])
+
+
+freeze_theme_terms(KEYWORD_THEMES, "keywords")
+freeze_theme_terms(COMPANY_THEMES, "keywords")
+freeze_theme_terms(COMPANY_EXTRA_CATALOG, "aliases")
+KEYWORD_THEME_SEARCH_QUERIES = {key: tuple(queries) for key, queries in KEYWORD_THEME_SEARCH_QUERIES.items()}
+
+
+def build_keyword_theme_index() -> dict[str, tuple[int, dict, str]]:
+    # needle -> (priority, theme, keyword); company themes win over topic themes for the same needle.
+    index: dict[str, tuple[int, dict, str]] = {}
+    for priority, themes in ((0, COMPANY_THEMES), (1, KEYWORD_THEMES)):
+        for theme in themes:
+            for keyword in theme.get("keywords", []):
+                needle = keyword.lower().strip()
+                if needle and needle not in index:
+                    index[needle] = (priority, theme, keyword)
+    return index
+
+
+def build_keyword_theme_pattern(priority: int) -> re.Pattern | None:
+    # Longest-first alternation: the leftmost match is also the longest needle at that position.
+    needles = sorted((n for n, entry in _KEYWORD_THEME_INDEX.items() if entry[0] == priority), key=len, reverse=True)
+    if not needles:
+        return None
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+_KEYWORD_THEME_INDEX = build_keyword_theme_index()
+_KEYWORD_THEME_PATTERNS = tuple(
+    pattern for pattern in (build_keyword_theme_pattern(0), build_keyword_theme_pattern(1)) if pattern is not None
+)
+
 if genai is not None and GEMINI_API_KEY:
     try:
         genai.configure(api_key=GEMINI_API_KEY)
@@ -633,7 +791,7 @@ if genai is not None and GEMINI_API_KEY:
 
 def slugify(value: str, max_len: int = 40) -> str:
     # Keep filenames OS-safe across locales by using ASCII slug + hash suffix.
-    slug = re.sub(r"[^0-9A-Za-z]+", "-", value).strip("-").lower()
+    slug = _SLUG_RE.sub("-", value).strip("-").lower()
     return (slug[:max_len] or "news").strip("-")
 
 
@@ -647,45 +805,80 @@ def safe_console_text(text: str) -> str:
 
 
 def normalize_space(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
+    return _WS_RE.sub(" ", text).strip() if text else ""
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_url(url: str) -> str:
     if not url:
         return ""
     value = url.strip()
-    if value.startswith("http://") or value.startswith("https://"):
+    if value.startswith(("http://", "https://")):
         return value
     return ""
 
 
-def get_image_digest(content: bytes) -> str:
-    return hashlib.sha1(content).hexdigest()
+def get_image_digest(content: bytes) -> bytes:
+    # In-run dedup only needs a fast collision-resistant key, not a hex string.
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def get_file_digest(path: Path) -> bytes:
+    # Stream through hashlib's fixed C buffer instead of copying the whole file into a bytes object.
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).digest()
+
 
+def get_cached_file_digest(path: Path) -> bytes:
+    # Pool files rarely change; reuse the digest while mtime and size still match.
+    st = path.stat()
+    key = str(path)
+    cached = _file_digest_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    digest = get_file_digest(path)
+    _file_digest_cache[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
 
-def claim_image_bytes_for_run(content: bytes) -> bool:
+
+def used_by_other_article_earlier(owners: dict, key, owner: str) -> bool:
+    # An article may keep the image it already had; only other articles' earlier picks are refused.
+    previous = owners.get(key)
+    return previous is not None and previous != owner
+
+
+def claim_image_bytes_for_run(content: bytes, owner: str = "") -> bool:
+    """Claim a newly downloaded image; owner identifies the article it is for."""
     if not content:
         return False
     if not IMAGE_DEDUP_IN_RUN:
         return True
-
     digest = get_image_digest(content)
+    if used_by_other_article_earlier(_earlier_image_hash_owners, digest, owner):
+        return False
+    return claim_image_digest_for_run(digest, owner)
+
+
+def claim_image_digest_for_run(digest: bytes, owner: str = "") -> bool:
     if digest in _used_image_hashes_in_run:
         return False
     _used_image_hashes_in_run.add(digest)
+    if _image_dedup_db is not None and owner:
+        _image_dedup_db.execute("INSERT OR IGNORE INTO image_owner VALUES (?, ?)", (digest, owner))
     return True
 
 
 def claim_cached_image_for_run(path: Path) -> bool:
-    if not path.exists():
-        return False
     try:
-        payload = path.read_bytes()
+        if path.stat().st_size < 256:
+            return False
+        if not IMAGE_DEDUP_IN_RUN:
+            return True
+        digest = get_file_digest(path)
     except Exception:
         return False
-    if len(payload) < 256:
-        return False
-    return claim_image_bytes_for_run(payload)
+    # An article reusing its own cached file only competes with this run's claims.
+    return claim_image_digest_for_run(digest)
 
 
 def remove_file_silent(path: Path):
@@ -695,7 +888,7 @@ def remove_file_silent(path: Path):
         pass
 
 
-def claim_remote_image_url_for_run(url: str) -> bool:
+def claim_remote_image_url_for_run(url: str, owner: str = "") -> bool:
     value = sanitize_url(url)
     if not value:
         return False
@@ -703,30 +896,82 @@ def claim_remote_image_url_for_run(url: str) -> bool:
         return True
     if value in _used_remote_image_urls_in_run:
         return False
+    if used_by_other_article_earlier(_earlier_remote_image_url_owners, value, owner):
+        return False
     _used_remote_image_urls_in_run.add(value)
+    if _image_dedup_db is not None and owner:
+        _image_dedup_db.execute("INSERT OR IGNORE INTO url_owner VALUES (?, ?)", (value, owner))
     return True
 
 
+def close_image_dedup_db():
+    global _image_dedup_db
+    if _image_dedup_db is None:
+        return
+    try:
+        _image_dedup_db.commit()
+        _image_dedup_db.close()
+    except Exception as e:
+        print(f"[WARN] Failed to save image dedup db: {e}")
+    _image_dedup_db = None
+
+
+def load_image_dedup_db():
+    """Preload image digests/URLs claimed by earlier runs, with the article that claimed each.
+
+    They are kept apart from the in-run sets: only new downloads/picks for a different
+    article are refused, so re-collected articles keep the images they already use.
+    """
+    global _image_dedup_db
+    if not IMAGE_DEDUP_IN_RUN or not IMAGE_DEDUP_ACROSS_RUNS or _image_dedup_db is not None:
+        return
+    try:
+        conn = sqlite3.connect(IMAGE_DEDUP_DB_PATH)
+        conn.execute("CREATE TABLE IF NOT EXISTS image_owner(digest BLOB PRIMARY KEY, owner TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS url_owner(url TEXT PRIMARY KEY, owner TEXT)")
+        _earlier_image_hash_owners.update(conn.execute("SELECT digest, owner FROM image_owner"))
+        _earlier_remote_image_url_owners.update(conn.execute("SELECT url, owner FROM url_owner"))
+    except Exception as e:
+        print(f"[WARN] Image dedup db unavailable: {e}")
+        return
+    _image_dedup_db = conn
+    atexit.register(close_image_dedup_db)
+
+
+def read_capped_body(res: requests.Response, max_bytes: int) -> bytes | None:
+    """Read a streamed body; None once it is declared or found to exceed max_bytes (0 = no cap)."""
+    declared = res.headers.get("content-length") or ""
+    if max_bytes and declared.isdigit() and int(declared) > max_bytes:
+        return None
+    buffer = bytearray()
+    for chunk in res.iter_content(chunk_size=65536):
+        buffer.extend(chunk)
+        if max_bytes and len(buffer) > max_bytes:
+            return None
+    return bytes(buffer)
+
+
 def fetch_image_payload(url: str, timeout: int) -> bytes:
     try:
-        res = requests.get(
+        # Stream so non-image responses are rejected from headers alone and oversized bodies are cut off.
+        with _http_session.get(
             url,
-            headers=REQUEST_HEADERS,
             timeout=max(5, timeout),
             allow_redirects=True,
-        )
-    except Exception:
-        return b""
+            stream=True,
+        ) as res:
+            if not res.ok:
+                return b""
 
-    if not res.ok:
-        return b""
+            content_type = (res.headers.get("content-type") or "").lower()
+            if "image/" not in content_type:
+                return b""
 
-    content_type = (res.headers.get("content-type") or "").lower()
-    if "image/" not in content_type:
+            payload = read_capped_body(res, MAX_STOCK_IMAGE_BYTES)
+    except Exception:
         return b""
 
-    payload = res.content or b""
-    if len(payload) < max(512, MIN_STOCK_IMAGE_BYTES):
+    if payload is None or len(payload) < max(512, MIN_STOCK_IMAGE_BYTES):
         return b""
 
     return payload
@@ -745,6 +990,7 @@ def clean_summary(text: str) -> str:
     if not text:
         return ""
     try:
+        # html.parser keeps "<![CDATA[...]]>" content as text; lxml's HTML parser turns it into a comment.
         soup = BeautifulSoup(text, "html.parser")
         return soup.get_text(" ", strip=True)
     except Exception:
@@ -752,14 +998,15 @@ def clean_summary(text: str) -> str:
 
 
 def clean_feed_text(text: str) -> str:
-    value = normalize_space(text or "")
+    value = normalize_space(text)
     # Some feeds (e.g., The Verge) expose CDATA markers as plain text.
-    if value.startswith("<![CDATA[") and value.endswith("]]>"):
-        value = value[len("<![CDATA[") : -len("]]>")]
-    return html.unescape(normalize_space(value))
+    if value.startswith(_CDATA_OPEN) and value.endswith(_CDATA_CLOSE):
+        # Inner whitespace is already collapsed; only the edges next to the markers remain.
+        value = value[len(_CDATA_OPEN) : -len(_CDATA_CLOSE)].strip()
+    return html.unescape(value)
 
 
-def extract_image_from_rss_item(item_soup, description_html: str) -> str:
+def extract_media_image_from_rss_item(item_soup) -> str:
     media_content = item_soup.find("media:content")
     if media_content:
         candidate = sanitize_url(media_content.get("url", ""))
@@ -779,19 +1026,30 @@ def extract_image_from_rss_item(item_soup, description_html: str) -> str:
             candidate = sanitize_url(enclosure.get("url", ""))
             if candidate:
                 return candidate
+    return ""
 
-    if description_html:
-        try:
-            desc_soup = BeautifulSoup(description_html, "html.parser")
-            image_tag = desc_soup.find("img")
-            if image_tag:
-                candidate = sanitize_url(image_tag.get("src", ""))
-                if candidate:
-                    return candidate
-        except Exception:
-            return ""
 
-    return ""
+def extract_image_from_description(description_html: str) -> str:
+    # Only the first <img> src is needed, so scan the markup instead of building a tree.
+    description_html = description_html or ""
+    # Markup inside a CDATA section is text to an HTML parser, not an <img> element.
+    if _CDATA_OPEN in description_html:
+        description_html = _CDATA_SECTION_RE.sub("", description_html)
+    image_tag = _IMG_TAG_RE.search(description_html)
+    if not image_tag:
+        return ""
+    src = _IMG_SRC_RE.search(image_tag.group(0))
+    if not src:
+        return ""
+    return sanitize_url(html.unescape(next(value for value in src.groups() if value is not None)))
+
+
+def parse_description_html(description_html: str, want_image: bool) -> tuple[str, str]:
+    """Parse an item description once; returns (plain text, first <img> src if wanted)."""
+    if not description_html:
+        return "", ""
+    image_url = extract_image_from_description(description_html) if want_image else ""
+    return clean_feed_text(clean_summary(description_html)), image_url
 
 
 def extract_feed_policy_meta(channel_soup) -> dict:
@@ -810,26 +1068,25 @@ def extract_feed_policy_meta(channel_soup) -> dict:
     }
 
 
-def parse_rss_feed(url: str, max_items: int = 10) -> dict:
-    """
-    Returns: {
-      "items": [
-        {"title", "link", "description", "description_html", "rss_image_url", "item_rights"}
-      ],
-      "meta": {"copyright", "rights", "license", "docs"}
-    }
-    """
-    try:
-        r = requests.get(url, headers=REQUEST_HEADERS, timeout=10)
-        if r.status_code != 200:
-            return {"items": [], "meta": {}}
+@dataclass(slots=True)
+class RssItem:
+    title: str
+    link: str
+    description: str
+    description_html: str
+    rss_image_url: str
+    item_rights: str
 
+
+def parse_rss_content(content: bytes, max_items: int = 10) -> dict:
+    try:
         try:
-            soup = BeautifulSoup(r.content, "xml")
+            soup = BeautifulSoup(content, "lxml-xml")
         except Exception:
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = BeautifulSoup(content, "html.parser")
+        # Atom feeds have no <item> and land here; html.parser keeps CDATA summaries intact.
         if not soup.find("item"):
-            soup = BeautifulSoup(r.content, "html.parser")
+            soup = BeautifulSoup(content, "html.parser")
 
         channel = soup.find("channel")
         feed_root = channel or soup.find("feed")
@@ -842,7 +1099,7 @@ def parse_rss_feed(url: str, max_items: int = 10) -> dict:
             atom_mode = True
         item_nodes = item_nodes[:max_items]
 
-        results: list[dict] = []
+        results: list[RssItem] = []
         for item in item_nodes:
             title_tag = item.find("title")
             if atom_mode:
@@ -863,8 +1120,12 @@ def parse_rss_feed(url: str, max_items: int = 10) -> dict:
                         link_url = sibling.strip()
 
             description_html = desc_tag.decode_contents() if desc_tag else ""
-            description_text = clean_feed_text(clean_summary(description_html))
-            rss_image_url = extract_image_from_rss_item(item, description_html)
+            # Media tags are probed first; the description is parsed once for both text and image.
+            rss_image_url = extract_media_image_from_rss_item(item)
+            description_text, description_image = parse_description_html(
+                description_html, want_image=not rss_image_url
+            )
+            rss_image_url = rss_image_url or description_image
             item_rights = (
                 get_tag_text(item, "media:copyright")
                 or get_tag_text(item, "rights")
@@ -874,14 +1135,14 @@ def parse_rss_feed(url: str, max_items: int = 10) -> dict:
             )
 
             results.append(
-                {
-                    "title": clean_feed_text(title_tag.get_text(strip=True) if title_tag else ""),
-                    "link": sanitize_url(link_url),
-                    "description": description_text,
-                    "description_html": description_html,
-                    "rss_image_url": rss_image_url,
-                    "item_rights": item_rights,
-                }
+                RssItem(
+                    title=clean_feed_text(title_tag.get_text(strip=True) if title_tag else ""),
+                    link=sanitize_url(link_url),
+                    description=description_text,
+                    description_html=description_html,
+                    rss_image_url=rss_image_url,
+                    item_rights=item_rights,
+                )
             )
 
         return {"items": results, "meta": feed_meta}
@@ -890,33 +1151,55 @@ def parse_rss_feed(url: str, max_items: int = 10) -> dict:
         return {"items": [], "meta": {}}
 
 
+def parse_rss_feed(url: str, max_items: int = 10) -> dict:
+    """
+    Returns: {
+      "items": [RssItem(title, link, description, description_html, rss_image_url, item_rights)],
+      "meta": {"copyright", "rights", "license", "docs"}
+    }
+    """
+    content = fetch_rss_content(url)
+    if not content:
+        return {"items": [], "meta": {}}
+    return parse_rss_content(content, max_items=max_items)
+
+
+def fetch_rss_content(url: str) -> bytes:
+    try:
+        r = _http_session.get(url, timeout=10)
+        if r.status_code != 200:
+            return b""
+        return r.content
+    except Exception as e:
+        print(f"RSS parsing error: {e}")
+        return b""
+
+
+def fetch_rss_feeds(feeds: dict[str, str], max_items: int = 10) -> dict[str, dict]:
+    """Fetch and parse several feeds concurrently; result keys follow `feeds` order."""
+    if not feeds:
+        return {}
+    workers = min(RSS_FETCH_WORKERS, len(feeds))
+    if RSS_PARSE_PROCESSES <= 1 or len(feeds) < 2:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(lambda url: parse_rss_feed(url, max_items=max_items), feeds.values())
+            return dict(zip(feeds.keys(), parsed))
+
+    # Backfill runs: fetch on threads, then move the CPU-bound soup parsing off the GIL.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = list(executor.map(fetch_rss_content, feeds.values()))
+    parse = functools.partial(parse_rss_content, max_items=max_items)
+    with ProcessPoolExecutor(max_workers=min(RSS_PARSE_PROCESSES, len(feeds))) as executor:
+        parsed = executor.map(parse, contents)
+        return dict(zip(feeds.keys(), parsed))
+
+
 def has_explicit_image_allowance(text: str) -> bool:
     sample = (text or "").strip().lower()
     if not sample:
         return False
 
-    allow_keywords = (
-        "creative commons",
-        "creativecommons.org/licenses",
-        "cc-by",
-        "cc by",
-        "cc-by-sa",
-        "cc by-sa",
-        "public domain",
-        "reuse permitted",
-        "redistribution permitted",
-        "republish permitted",
-    )
-    deny_keywords = (
-        "all rights reserved",
-        "do not reproduce",
-        "no redistribution",
-        "unauthorized reproduction prohibited",
-    )
-
-    has_allow = any(keyword in sample for keyword in allow_keywords)
-    has_deny = any(keyword in sample for keyword in deny_keywords)
-    return has_allow and not has_deny
+    return _IMAGE_ALLOW_RE.search(sample) is not None and _IMAGE_DENY_RE.search(sample) is None
 
 
 def feed_explicitly_allows_rss_images(feed_meta: dict) -> bool:
@@ -954,11 +1237,7 @@ def should_use_rss_source_image(
     return feed_allows
 
 
-def get_company_catalog() -> list[dict]:
-    global _company_catalog_cache
-    if _company_catalog_cache is not None:
-        return _company_catalog_cache
-
+def build_company_catalog() -> list[dict]:
     merged: dict[str, dict] = {}
 
     for theme in COMPANY_THEMES:
@@ -1007,96 +1286,90 @@ def get_company_catalog() -> list[dict]:
 
     catalog: list[dict] = []
     for entry in merged.values():
-        aliases = [(a or "").strip() for a in entry.get("aliases", []) if (a or "").strip()]
-        aliases.append(entry.get("name", ""))
-        aliases.append(entry.get("id", ""))
-
-        # Stable de-dup preserving order, then prefer longer aliases for matching precision.
-        seen: set[str] = set()
-        ordered_aliases: list[str] = []
-        for alias in aliases:
+        # De-dup by lowercase (first spelling wins), then prefer longer aliases for matching precision.
+        by_lower: dict[str, str] = {}
+        for alias in [(a or "").strip() for a in entry.get("aliases", [])] + [entry.get("name", ""), entry.get("id", "")]:
             k = alias.lower()
-            if not k or k in seen:
-                continue
-            seen.add(k)
-            ordered_aliases.append(alias)
-        ordered_aliases.sort(key=lambda x: (-len(x), x.lower()))
+            if k and k not in by_lower:
+                by_lower[k] = alias
+        ordered_aliases = [alias for _, alias in sorted(by_lower.items(), key=lambda item: (-len(item[1]), item[0]))]
 
+        label = entry.get("label") or (entry.get("name") or entry["id"]).upper()
+        subtitle = entry.get("subtitle") or entry.get("name") or entry["id"]
         catalog.append(
             {
                 "id": entry["id"],
                 "name": entry.get("name") or entry["id"],
-                "label": entry.get("label") or (entry.get("name") or entry["id"]).upper(),
-                "subtitle": entry.get("subtitle") or entry.get("name") or entry["id"],
-                "domain": entry.get("domain", ""),
+                "label": label,
+                "subtitle": subtitle,
+                "domain": (entry.get("domain") or "").strip().lower(),
                 "aliases": ordered_aliases,
+                # Escaped, truncated SVG text shared by every variant render of this company.
+                "label_svg": html.escape(label.upper()[:18]).encode("utf-8"),
+                "subtitle_svg": html.escape(subtitle[:24]).encode("utf-8"),
             }
         )
 
-    _company_catalog_cache = catalog
     return catalog
 
 
-def find_alias_position(text_lower: str, alias: str) -> int:
-    needle = (alias or "").strip().lower()
-    if not needle:
-        return -1
+# Themes, extra catalog and logo domains merged once at import; lookups by id go through this map.
+_company_catalog_cache: list[dict] = build_company_catalog()
+_COMPANY_CATALOG = {entry["id"]: entry for entry in _company_catalog_cache}
 
-    # Use boundaries for ASCII-ish aliases to avoid matching "arm" inside "alarm".
-    if re.fullmatch(r"[a-z0-9 .+\-&]+", needle):
-        pattern = rf"(?<![a-z0-9]){re.escape(needle)}(?![a-z0-9])"
-        match = re.search(pattern, text_lower)
-        return match.start() if match else -1
 
-    return text_lower.find(needle)
+def get_company_domain(theme: dict) -> str:
+    # Catalog entries already carry a normalized domain.
+    if _COMPANY_CATALOG.get(theme.get("id")) is theme:
+        return theme["domain"]
+    domain = (theme.get("domain") or "").strip().lower()
+    if domain:
+        return domain
+    entry = _COMPANY_CATALOG.get((theme.get("id") or "").strip().lower())
+    return entry["domain"] if entry else ""
 
 
 def infer_company_like_token_from_title(title: str) -> str:
     # Fallback for uncatalogued companies in English headlines.
-    tokens = re.findall(r"\b[A-Z][A-Za-z0-9&.+-]{2,24}\b", title or "")
-    ignore = {
-        "The",
-        "This",
-        "That",
-        "Why",
-        "How",
-        "What",
-        "When",
-        "Where",
-        "Who",
-        "Its",
-        "Their",
-        "US",
-        "UK",
-        "EU",
-        "AI",
-        "IT",
-        "CEO",
-        "CFO",
-        "CTO",
-        "RSS",
-    }
+    tokens = _TITLE_TOKEN_RE.findall(title or "")
     for token in tokens:
-        if token in ignore:
+        if token in _TITLE_TOKEN_IGNORE:
             continue
         return token
     return ""
 
 
-def find_company_theme_in_title(title: str):
-    text_lower = (title or "").lower()
-    best_match = None
-    for company in get_company_catalog():
+def build_company_alias_matcher(catalog: list[dict]) -> tuple[re.Pattern | None, dict[str, tuple[dict, str]]]:
+    # needle -> (company, alias); the first catalog entry wins, as the old per-alias scan did on ties.
+    index: dict[str, tuple[dict, str]] = {}
+    for company in catalog:
         for alias in company.get("aliases", []):
-            pos = find_alias_position(text_lower, alias)
-            if pos < 0:
-                continue
-            score = (pos, -len(alias))
-            if best_match is None or score < best_match[0]:
-                best_match = (score, company, alias)
+            needle = (alias or "").strip().lower()
+            if needle and needle not in index:
+                index[needle] = (company, alias)
+    if not index:
+        return None, index
 
-    if best_match:
-        return best_match[1], best_match[2]
+    # Longest-first alternation: the leftmost hit is the longest alias at that position.
+    # ASCII-ish aliases keep their word boundaries so "arm" does not match inside "alarm".
+    alternatives = []
+    for needle in sorted(index, key=len, reverse=True):
+        escaped = re.escape(needle)
+        if _ASCII_ALIAS_RE.fullmatch(needle):
+            escaped = rf"(?<![a-z0-9]){escaped}(?![a-z0-9])"
+        alternatives.append(escaped)
+    return re.compile("|".join(alternatives)), index
+
+
+_COMPANY_ALIAS_RE, _COMPANY_ALIAS_INDEX = build_company_alias_matcher(_company_catalog_cache)
+
+
+def find_company_theme_in_title(title: str, text_lower: str | None = None):
+    if text_lower is None:
+        text_lower = (title or "").lower()
+    match = _COMPANY_ALIAS_RE.search(text_lower) if _COMPANY_ALIAS_RE is not None else None
+    if match:
+        return _COMPANY_ALIAS_INDEX[match.group(0)]
 
     if not COMPANY_INFER_FROM_ENGLISH_TITLE:
         return None, ""
@@ -1117,9 +1390,14 @@ def find_company_theme_in_title(title: str):
     return dynamic_company, inferred
 
 
+@functools.lru_cache(maxsize=4096)
+def find_company_theme_cached(title: str):
+    # Syndicated headlines repeat across sources; the catalog is fixed for the process.
+    return find_company_theme_in_title(title)
+
+
 def get_company_logo_url(theme: dict) -> str:
-    theme_id = (theme.get("id") or "").strip().lower()
-    domain = (theme.get("domain") or "").strip().lower() or COMPANY_LOGO_DOMAINS.get(theme_id, "")
+    domain = get_company_domain(theme)
     if not domain:
         return ""
     # Remote logo endpoint (Clearbit) - returns brand logo by company domain.
@@ -1128,28 +1406,32 @@ def get_company_logo_url(theme: dict) -> str:
 
 def fetch_small_image_payload(url: str, timeout: int, min_bytes: int = 120) -> bytes:
     try:
-        res = requests.get(
+        with _http_session.get(
             url,
-            headers=REQUEST_HEADERS,
             timeout=max(5, timeout),
             allow_redirects=True,
-        )
-    except Exception:
-        return b""
+            stream=True,
+        ) as res:
+            if not res.ok:
+                return b""
 
-    if not res.ok:
-        return b""
+            content_type = (res.headers.get("content-type") or "").lower()
+            if "image/" not in content_type:
+                return b""
 
-    content_type = (res.headers.get("content-type") or "").lower()
-    if "image/" not in content_type:
+            payload = read_capped_body(res, MAX_STOCK_IMAGE_BYTES)
+    except Exception:
         return b""
 
-    payload = res.content or b""
-    if len(payload) < max(64, min_bytes):
+    if payload is None or len(payload) < max(64, min_bytes):
         return b""
     return payload
 
 
+def build_data_uri(payload: bytes, mime: str) -> str:
+    return f"data:{mime};base64,{base64.b64encode(payload).decode('ascii')}"
+
+
 def fetch_company_logo_data_uri(theme: dict) -> str:
     theme_id = (theme.get("id") or "").strip().lower()
     if not theme_id:
@@ -1157,7 +1439,20 @@ def fetch_company_logo_data_uri(theme: dict) -> str:
     if theme_id in _company_logo_data_uri_cache:
         return _company_logo_data_uri_cache[theme_id]
 
-    domain = (theme.get("domain") or "").strip().lower() or COMPANY_LOGO_DOMAINS.get(theme_id, "")
+    # Logos are kept as plain files; the data URI is only built when a variant SVG is rendered.
+    logo_dir = IMAGE_OUTPUT_DIR / "company_logos"
+    for ext, mime in COMPANY_LOGO_FILE_MIME.items():
+        logo_path = logo_dir / f"{theme_id}{ext}"
+        try:
+            payload = logo_path.read_bytes() if logo_path.exists() else b""
+        except Exception:
+            payload = b""
+        if payload:
+            data_uri = build_data_uri(payload, mime)
+            _company_logo_data_uri_cache[theme_id] = data_uri
+            return data_uri
+
+    domain = get_company_domain(theme)
     if not domain:
         _company_logo_data_uri_cache[theme_id] = ""
         return ""
@@ -1169,86 +1464,113 @@ def fetch_company_logo_data_uri(theme: dict) -> str:
         f"https://icons.duckduckgo.com/ip3/{domain}.ico",
     ]
 
-    for logo_url in logo_urls:
-        payload = fetch_small_image_payload(logo_url, timeout=10, min_bytes=120)
-        if not payload:
-            continue
-        ext = Path(logo_url.split("?")[0]).suffix.lower()
-        if ext == ".svg":
-            mime = "image/svg+xml"
-        elif ext == ".ico":
-            mime = "image/x-icon"
-        else:
-            mime = "image/png"
-        b64 = base64.b64encode(payload).decode("ascii")
-        data_uri = f"data:{mime};base64,{b64}"
-        _company_logo_data_uri_cache[theme_id] = data_uri
-        return data_uri
+    # Request every candidate at once but keep the list order as the preference order.
+    executor = ThreadPoolExecutor(max_workers=len(logo_urls))
+    try:
+        payloads = executor.map(lambda url: fetch_small_image_payload(url, timeout=10, min_bytes=120), logo_urls)
+        for logo_url, payload in zip(logo_urls, payloads):
+            if not payload:
+                continue
+            ext = Path(logo_url.split("?")[0]).suffix.lower()
+            if ext not in COMPANY_LOGO_FILE_MIME:
+                ext = ".png"
+            try:
+                logo_dir.mkdir(parents=True, exist_ok=True)
+                (logo_dir / f"{theme_id}{ext}").write_bytes(payload)
+            except Exception as e:
+                print(f"[WARN] Failed to store logo for {theme_id}: {e}")
+            data_uri = build_data_uri(payload, COMPANY_LOGO_FILE_MIME[ext])
+            _company_logo_data_uri_cache[theme_id] = data_uri
+            return data_uri
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     _company_logo_data_uri_cache[theme_id] = ""
     return ""
 
 
-def render_company_variant_svg(theme: dict, output_path: Path, logo_href: str, variant_index: int):
-    theme_id = (theme.get("id") or "brand").lower()
-    label = html.escape(theme.get("label", theme_id).upper()[:18])
-    subtitle = html.escape(theme.get("subtitle", theme_id.title())[:24])
-
-    palettes = [
-        ("#0f172a", "#1d4ed8", "#38bdf8"),
-        ("#111827", "#334155", "#14b8a6"),
-        ("#0b132b", "#1e3a8a", "#60a5fa"),
-        ("#1f2937", "#4f46e5", "#a78bfa"),
-        ("#042f2e", "#0f766e", "#34d399"),
-    ]
-    logo_layouts = [
-        (312, 240, 400, 400),
-        (272, 300, 480, 300),
-        (350, 260, 324, 324),
-        (280, 248, 460, 360),
-        (330, 320, 360, 260),
-    ]
-    p1, p2, p3 = palettes[(variant_index - 1) % len(palettes)]
-    lx, ly, lw, lh = logo_layouts[(variant_index - 1) % len(logo_layouts)]
-    logo_ref = html.escape(logo_href or "", quote=True)
-
-    overlay = ""
-    if variant_index % 5 == 1:
-        overlay = '<circle cx="860" cy="170" r="140" fill="rgba(255,255,255,0.14)" />'
-    elif variant_index % 5 == 2:
-        overlay = '<rect x="70" y="90" width="300" height="180" rx="28" fill="rgba(255,255,255,0.15)" />'
-    elif variant_index % 5 == 3:
-        overlay = '<path d="M110 820 C340 640, 620 900, 920 700" fill="none" stroke="rgba(255,255,255,0.26)" stroke-width="12" />'
-    elif variant_index % 5 == 4:
-        overlay = '<circle cx="180" cy="840" r="170" fill="rgba(255,255,255,0.12)" />'
-    else:
-        overlay = '<rect x="710" y="80" width="240" height="240" rx="120" fill="rgba(255,255,255,0.15)" />'
-
-    logo_layer = f'<image href="{logo_ref}" x="{lx}" y="{ly}" width="{lw}" height="{lh}" preserveAspectRatio="xMidYMid meet" />'
-    if not logo_ref:
-        logo_layer = (
-            f'<rect x="{lx}" y="{ly}" width="{lw}" height="{lh}" rx="28" fill="rgba(255,255,255,0.18)" />'
-            f'<text x="{lx + 40}" y="{ly + int(lh / 2)}" fill="white" font-size="54" font-family="Arial, sans-serif" font-weight="800">{label}</text>'
-        )
-
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024">
+# Static SVG skeletons are encoded once; only the escaped per-article fields are spliced in.
+COMPANY_VARIANT_PALETTES = (
+    (b"#0f172a", b"#1d4ed8", b"#38bdf8"),
+    (b"#111827", b"#334155", b"#14b8a6"),
+    (b"#0b132b", b"#1e3a8a", b"#60a5fa"),
+    (b"#1f2937", b"#4f46e5", b"#a78bfa"),
+    (b"#042f2e", b"#0f766e", b"#34d399"),
+)
+COMPANY_VARIANT_LOGO_LAYOUTS = (
+    (312, 240, 400, 400),
+    (272, 300, 480, 300),
+    (350, 260, 324, 324),
+    (280, 248, 460, 360),
+    (330, 320, 360, 260),
+)
+# Indexed by variant_index % 5.
+COMPANY_VARIANT_OVERLAYS = (
+    b'<rect x="710" y="80" width="240" height="240" rx="120" fill="rgba(255,255,255,0.15)" />',
+    b'<circle cx="860" cy="170" r="140" fill="rgba(255,255,255,0.14)" />',
+    b'<rect x="70" y="90" width="300" height="180" rx="28" fill="rgba(255,255,255,0.15)" />',
+    b'<path d="M110 820 C340 640, 620 900, 920 700" fill="none" stroke="rgba(255,255,255,0.26)" stroke-width="12" />',
+    b'<circle cx="180" cy="840" r="170" fill="rgba(255,255,255,0.12)" />',
+)
+COMPANY_VARIANT_SVG_TEMPLATE = b"""<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024">
   <defs>
     <linearGradient id="cbg" x1="0" y1="0" x2="1" y2="1">
-      <stop offset="0%" stop-color="{p1}" />
-      <stop offset="60%" stop-color="{p2}" />
-      <stop offset="100%" stop-color="{p3}" />
+      <stop offset="0%%" stop-color="%(p1)s" />
+      <stop offset="60%%" stop-color="%(p2)s" />
+      <stop offset="100%%" stop-color="%(p3)s" />
     </linearGradient>
   </defs>
   <rect width="1024" height="1024" fill="url(#cbg)" />
-  {overlay}
+  %(overlay)s
   <rect x="76" y="74" width="320" height="54" rx="27" fill="rgba(255,255,255,0.2)" />
-  <text x="102" y="110" fill="white" font-size="30" font-family="Arial, sans-serif" font-weight="700">{label}</text>
-  <text x="80" y="920" fill="#e2e8f0" font-size="34" font-family="Arial, sans-serif">{subtitle}</text>
-  <rect x="{lx - 24}" y="{ly - 24}" width="{lw + 48}" height="{lh + 48}" rx="34" fill="rgba(255,255,255,0.16)" />
-  {logo_layer}
+  <text x="102" y="110" fill="white" font-size="30" font-family="Arial, sans-serif" font-weight="700">%(label)s</text>
+  <text x="80" y="920" fill="#e2e8f0" font-size="34" font-family="Arial, sans-serif">%(subtitle)s</text>
+  <rect x="%(fx)d" y="%(fy)d" width="%(fw)d" height="%(fh)d" rx="34" fill="rgba(255,255,255,0.16)" />
+  %(logo_layer)s
 </svg>
 """
-    output_path.write_text(svg, encoding="utf-8")
+COMPANY_VARIANT_LOGO_IMAGE = (
+    b'<image href="%(href)s" x="%(lx)d" y="%(ly)d" width="%(lw)d" height="%(lh)d" preserveAspectRatio="xMidYMid meet" />'
+)
+COMPANY_VARIANT_LOGO_FALLBACK = (
+    b'<rect x="%(lx)d" y="%(ly)d" width="%(lw)d" height="%(lh)d" rx="28" fill="rgba(255,255,255,0.18)" />'
+    b'<text x="%(tx)d" y="%(ty)d" fill="white" font-size="54" font-family="Arial, sans-serif" font-weight="800">%(label)s</text>'
+)
+
+
+def render_company_variant_svg(theme: dict, output_path: Path, logo_href: str, variant_index: int):
+    theme_id = (theme.get("id") or "brand").lower()
+    label = theme.get("label_svg") or html.escape(theme.get("label", theme_id).upper()[:18]).encode("utf-8")
+    subtitle = theme.get("subtitle_svg") or html.escape(theme.get("subtitle", theme_id.title())[:24]).encode("utf-8")
+
+    p1, p2, p3 = COMPANY_VARIANT_PALETTES[(variant_index - 1) % len(COMPANY_VARIANT_PALETTES)]
+    lx, ly, lw, lh = COMPANY_VARIANT_LOGO_LAYOUTS[(variant_index - 1) % len(COMPANY_VARIANT_LOGO_LAYOUTS)]
+    logo_ref = html.escape(logo_href or "", quote=True).encode("utf-8")
+    box = {b"lx": lx, b"ly": ly, b"lw": lw, b"lh": lh}
+
+    if logo_ref:
+        logo_layer = COMPANY_VARIANT_LOGO_IMAGE % {**box, b"href": logo_ref}
+    else:
+        logo_layer = COMPANY_VARIANT_LOGO_FALLBACK % {**box, b"tx": lx + 40, b"ty": ly + int(lh / 2), b"label": label}
+
+    svg = COMPANY_VARIANT_SVG_TEMPLATE % {
+        b"p1": p1,
+        b"p2": p2,
+        b"p3": p3,
+        b"overlay": COMPANY_VARIANT_OVERLAYS[variant_index % 5],
+        b"label": label,
+        b"subtitle": subtitle,
+        b"fx": lx - 24,
+        b"fy": ly - 24,
+        b"fw": lw + 48,
+        b"fh": lh + 48,
+        b"logo_layer": logo_layer,
+    }
+    output_path.write_bytes(svg)
+
+
+def is_pool_image_entry(entry: os.DirEntry) -> bool:
+    return os.path.splitext(entry.name)[1].lower() in POOL_IMAGE_EXTENSIONS and entry.is_file()
 
 
 def discover_local_company_variant_images(theme_id: str, limit: int | None = None) -> list[str]:
@@ -1259,40 +1581,31 @@ def discover_local_company_variant_images(theme_id: str, limit: int | None = Non
     if not base_dir.exists():
         return []
 
-    allowed_ext = {".png", ".jpg", ".jpeg", ".webp", ".svg", ".gif", ".ico"}
+    # One scandir per directory instead of four overlapping globs plus resolve() per hit.
+    prefixes = (f"{theme_id}-", f"{theme_id}_")
     candidates: list[Path] = []
-
-    root_patterns = [
-        f"{theme_id}-v*.*",
-        f"{theme_id}_v*.*",
-        f"{theme_id}-*.*",
-        f"{theme_id}_*.*",
-    ]
-    for pattern in root_patterns:
-        candidates.extend(base_dir.glob(pattern))
-
-    nested_dir = base_dir / theme_id
-    if nested_dir.exists() and nested_dir.is_dir():
-        candidates.extend(nested_dir.glob("*.*"))
-
-    unique: dict[str, Path] = {}
-    for file_path in candidates:
-        if not file_path.is_file():
-            continue
-        if file_path.suffix.lower() not in allowed_ext:
-            continue
-        unique[str(file_path.resolve())] = file_path
+    try:
+        with os.scandir(base_dir) as entries:
+            candidates.extend(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(prefixes) and is_pool_image_entry(entry)
+            )
+        nested_dir = base_dir / theme_id
+        if nested_dir.is_dir():
+            with os.scandir(nested_dir) as entries:
+                candidates.extend(Path(entry.path) for entry in entries if is_pool_image_entry(entry))
+    except OSError:
+        return []
 
     def order_key(path: Path):
         stem = path.stem.lower()
-        match = re.search(r"(?:^|[-_])v?(\d+)$", stem)
-        if not match:
-            match = re.search(r"(?:^|[-_])v?(\d+)(?:[-_].*)?$", stem)
+        match = _VARIANT_SEQ_TAIL_RE.search(stem) or _VARIANT_SEQ_RE.search(stem)
         seq = int(match.group(1)) if match else 10_000
         auto_bias = 1 if stem.startswith("auto-") else 0
         return (auto_bias, seq, path.name.lower())
 
-    ordered = sorted(unique.values(), key=order_key)
+    ordered = sorted(candidates, key=order_key)
     if not ordered:
         return []
     if limit is not None and limit > 0:
@@ -1300,35 +1613,54 @@ def discover_local_company_variant_images(theme_id: str, limit: int | None = Non
     return [to_web_path(p) for p in ordered]
 
 
+MIME_SUBTYPE_EXTENSIONS = {
+    "svg+xml": ".svg",
+    "svg": ".svg",
+    "png": ".png",
+    "x-png": ".png",
+    "webp": ".webp",
+    "gif": ".gif",
+    "x-icon": ".ico",
+    "vnd.microsoft.icon": ".ico",
+    "ico": ".ico",
+    "jpeg": ".jpg",
+    "jpg": ".jpg",
+    "pjpeg": ".jpg",
+}
+# Substring fallback for unusual content types, checked in the original priority order.
+MIME_MARKER_EXTENSIONS = (
+    (("svg",), ".svg"),
+    (("png",), ".png"),
+    (("webp",), ".webp"),
+    (("gif",), ".gif"),
+    (("icon", "ico"), ".ico"),
+    (("jpeg", "jpg"), ".jpg"),
+)
+
+
 def guess_extension_from_mime_or_url(content_type: str, url: str) -> str:
     ct = (content_type or "").lower()
-    if "svg" in ct:
-        return ".svg"
-    if "png" in ct:
-        return ".png"
-    if "webp" in ct:
-        return ".webp"
-    if "gif" in ct:
-        return ".gif"
-    if "icon" in ct or "ico" in ct:
-        return ".ico"
-    if "jpeg" in ct or "jpg" in ct:
-        return ".jpg"
+    ext = MIME_SUBTYPE_EXTENSIONS.get(ct.partition("/")[2].partition(";")[0].strip())
+    if ext:
+        return ext
+    for markers, marker_ext in MIME_MARKER_EXTENSIONS:
+        if any(marker in ct for marker in markers):
+            return marker_ext
 
     suffix = Path(url.split("?")[0]).suffix.lower()
-    if suffix in {".png", ".jpg", ".jpeg", ".webp", ".gif", ".svg", ".ico"}:
+    if suffix in POOL_IMAGE_EXTENSIONS:
         return suffix
     return ".jpg"
 
 
-def load_company_image_hashes(image_paths: list[str]) -> set[str]:
-    hashes: set[str] = set()
+def load_company_image_hashes(image_paths: list[str]) -> set[bytes]:
+    hashes: set[bytes] = set()
     for p in image_paths:
         path = Path(p)
         if not path.exists():
             continue
         try:
-            hashes.add(hashlib.sha1(path.read_bytes()).hexdigest())
+            hashes.add(get_cached_file_digest(path))
         except Exception:
             continue
     return hashes
@@ -1336,7 +1668,7 @@ def load_company_image_hashes(image_paths: list[str]) -> set[str]:
 
 def search_wikimedia_image_urls(query: str, max_urls: int) -> list[str]:
     try:
-        res = requests.get(
+        res = _http_session.get(
             "https://commons.wikimedia.org/w/api.php",
             params={
                 "action": "query",
@@ -1348,12 +1680,11 @@ def search_wikimedia_image_urls(query: str, max_urls: int) -> list[str]:
                 "iiprop": "url|mime",
                 "format": "json",
             },
-            headers=REQUEST_HEADERS,
             timeout=max(4, min(8, COMPANY_SEARCH_TIMEOUT)),
         )
         if not res.ok:
             return []
-        data = res.json()
+        data = loads_json(res.content)
     except Exception:
         return []
 
@@ -1368,10 +1699,14 @@ def search_wikimedia_image_urls(query: str, max_urls: int) -> list[str]:
     return urls
 
 
-def build_company_search_queries(theme: dict) -> list[str]:
+def build_company_search_queries(theme: dict) -> tuple[str, ...]:
     company_name = (theme.get("name") or theme.get("subtitle") or theme.get("label") or theme.get("id") or "").strip()
-    aliases = [a for a in theme.get("aliases", []) if a][:5]
+    aliases = tuple([a for a in theme.get("aliases", []) if a][:5])
+    return build_company_search_queries_cached(company_name, aliases)
 
+
+@functools.lru_cache(maxsize=512)
+def build_company_search_queries_cached(company_name: str, aliases: tuple[str, ...]) -> tuple[str, ...]:
     queries = [
         f"{company_name} logo",
         f"{company_name} company logo",
@@ -1391,7 +1726,7 @@ def build_company_search_queries(theme: dict) -> list[str]:
             continue
         seen.add(norm)
         output.append(q)
-    return output
+    return tuple(output)
 
 
 def build_company_candidate_urls(theme: dict, max_urls: int = 60) -> list[str]:
@@ -1399,14 +1734,17 @@ def build_company_candidate_urls(theme: dict, max_urls: int = 60) -> list[str]:
     queries = build_company_search_queries(theme)
     company_name = (theme.get("name") or theme.get("subtitle") or theme.get("label") or theme.get("id") or "").strip()
 
-    # Primary: Wikimedia Commons search results.
-    for query in queries[:3]:
-        urls.extend(search_wikimedia_image_urls(query, max_urls=12))
-        if len(urls) >= max_urls:
-            break
+    # Primary: Wikimedia Commons search results (queries run concurrently, merged in query order).
+    wiki_queries = queries[:3]
+    if wiki_queries:
+        with ThreadPoolExecutor(max_workers=len(wiki_queries)) as executor:
+            for found in executor.map(lambda query: search_wikimedia_image_urls(query, max_urls=12), wiki_queries):
+                urls.extend(found)
+                if len(urls) >= max_urls:
+                    break
 
     # Secondary: direct domain logo/favicons.
-    domain = (theme.get("domain") or "").strip().lower() or COMPANY_LOGO_DOMAINS.get((theme.get("id") or "").strip().lower(), "")
+    domain = get_company_domain(theme)
     if domain:
         for size in [64, 96, 128, 192, 256, 384, 512]:
             urls.append(f"https://logo.clearbit.com/{domain}?size={size}")
@@ -1414,7 +1752,7 @@ def build_company_candidate_urls(theme: dict, max_urls: int = 60) -> list[str]:
         urls.append(f"https://icons.duckduckgo.com/ip3/{domain}.ico")
 
     # Tertiary: generic image search-style endpoints (not logo-only fallback).
-    seed_base = int(hashlib.sha1((theme.get("id") or company_name).encode("utf-8")).hexdigest()[:8], 16) % 10_000
+    seed_base = int.from_bytes(hashlib.sha1((theme.get("id") or company_name).encode("utf-8")).digest()[:4], "big") % 10_000
     for i, query in enumerate(queries[:4]):
         urls.append(f"https://source.unsplash.com/1600x900/?{quote_plus(query)}&sig={seed_base + i}")
         urls.append(f"https://loremflickr.com/1600/900/{quote_plus(query)},technology?lock={seed_base + i}")
@@ -1437,35 +1775,42 @@ def build_company_candidate_urls(theme: dict, max_urls: int = 60) -> list[str]:
     return output
 
 
-def store_company_candidate_image(theme_id: str, url: str, known_hashes: set[str]) -> str:
+def fetch_company_candidate_image(url: str) -> tuple[bytes, str]:
     try:
-        res = requests.get(
+        with _http_session.get(
             url,
-            headers=REQUEST_HEADERS,
             timeout=max(4, min(8, COMPANY_SEARCH_TIMEOUT)),
             allow_redirects=True,
-        )
+            stream=True,
+        ) as res:
+            if not res.ok:
+                return b"", ""
+            content_type = (res.headers.get("content-type") or "").lower()
+            if "image/" not in content_type:
+                return b"", ""
+            payload = read_capped_body(res, MAX_STOCK_IMAGE_BYTES)
     except Exception:
-        return ""
+        return b"", ""
+
+    if payload is None:
+        return b"", ""
+    return payload, content_type
 
-    if not res.ok:
-        return ""
-    content_type = (res.headers.get("content-type") or "").lower()
-    if "image/" not in content_type:
-        return ""
 
-    payload = res.content or b""
+def store_company_candidate_image(
+    theme_id: str, url: str, payload: bytes, content_type: str, known_hashes: set[bytes]
+) -> str:
     if len(payload) < 80:
         return ""
 
-    digest = hashlib.sha1(payload).hexdigest()
+    digest = get_image_digest(payload)
     if digest in known_hashes:
         return ""
 
     ext = guess_extension_from_mime_or_url(content_type=content_type, url=url)
     out_dir = COMPANY_IMAGE_POOL_DIR / theme_id
     out_dir.mkdir(parents=True, exist_ok=True)
-    out_path = out_dir / f"auto-{digest[:14]}{ext}"
+    out_path = out_dir / f"auto-{digest.hex()[:14]}{ext}"
     if not out_path.exists():
         try:
             out_path.write_bytes(payload)
@@ -1490,21 +1835,93 @@ def populate_company_image_pool(theme: dict, target_count: int) -> int:
     added = 0
     missing = max(0, target_count - current_count)
     max_attempts = max(18, min(60, missing * 8))
-    attempts = 0
-
-    for candidate_url in build_company_candidate_urls(theme, max_urls=max_attempts):
-        attempts += 1
-        if attempts > max_attempts:
-            break
-        if current_count + added >= target_count:
-            break
-        saved = store_company_candidate_image(theme_id=theme_id, url=candidate_url, known_hashes=known_hashes)
-        if not saved:
-            continue
-        added += 1
+    candidate_urls = build_company_candidate_urls(theme, max_urls=max_attempts)[:max_attempts]
+
+    # Downloads overlap in windows; candidates are still stored in list order so the pool stays deterministic.
+    window = IMAGE_FETCH_WORKERS
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        for start in range(0, len(candidate_urls), window):
+            if current_count + added >= target_count:
+                break
+            batch = candidate_urls[start : start + window]
+            for candidate_url, (payload, content_type) in zip(batch, executor.map(fetch_company_candidate_image, batch)):
+                if current_count + added >= target_count:
+                    break
+                saved = store_company_candidate_image(
+                    theme_id=theme_id,
+                    url=candidate_url,
+                    payload=payload,
+                    content_type=content_type,
+                    known_hashes=known_hashes,
+                )
+                if not saved:
+                    continue
+                added += 1
     return added
 
 
+def get_company_pool_stamp(theme_id: str) -> list:
+    """mtimes of the pool directories discovery reads; any file added or removed changes one."""
+    stamp = []
+    for directory in (COMPANY_IMAGE_POOL_DIR, COMPANY_IMAGE_POOL_DIR / theme_id):
+        try:
+            stamp.append(directory.stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+def company_variants_need_refresh(source: str, count: int) -> bool:
+    """Whether ensure_company_variant_images would do more than rediscover the same files."""
+    if source in ("local-pool", "searched-pool"):
+        # A pool short of the target is topped up by search on every run.
+        return not COMPANY_LOCAL_IMAGE_MODE or (COMPANY_SEARCH_IMAGE_ENABLED and count < COMPANY_SEARCH_IMAGE_TARGET)
+    # Logo variants mean no pool was found; search may fill one this run.
+    return COMPANY_LOCAL_IMAGE_MODE and COMPANY_SEARCH_IMAGE_ENABLED
+
+
+def save_company_caches():
+    try:
+        COMPANY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        variants = {
+            theme_id: {
+                "paths": paths,
+                "source": _company_variant_source_cache.get(theme_id, ""),
+                "pool_stamp": get_company_pool_stamp(theme_id),
+            }
+            for theme_id, paths in _company_variant_paths_cache.items()
+            if paths
+        }
+        dump_json(variants, COMPANY_CACHE_DIR / "company_variant_paths.json")
+    except Exception as e:
+        print(f"[WARN] Failed to save company caches: {e}")
+
+
+def load_company_caches():
+    """Rehydrate variant paths from the previous run; saved again at exit. Logos persist as files."""
+    if not COMPANY_CACHE_PERSIST:
+        return
+    try:
+        variants_path = COMPANY_CACHE_DIR / "company_variant_paths.json"
+        if variants_path.exists():
+            for theme_id, entry in load_json(variants_path).items():
+                paths = list(entry.get("paths") or [])
+                source = entry.get("source") or ""
+                # Entries go stale when the pool directory changed or a fresh run would search again.
+                if not paths or entry.get("pool_stamp") != get_company_pool_stamp(theme_id):
+                    continue
+                if company_variants_need_refresh(source, len(paths)):
+                    continue
+                # ensure_company_variant_images re-checks that every path still exists.
+                _company_variant_paths_cache[theme_id] = paths
+                if source:
+                    _company_variant_source_cache[theme_id] = source
+    except Exception as e:
+        print(f"[WARN] Failed to load company caches: {e}")
+    atexit.unregister(save_company_caches)
+    atexit.register(save_company_caches)
+
+
 def ensure_company_variant_images(theme: dict) -> list[str]:
     theme_id = (theme.get("id") or "").strip().lower()
     if not theme_id:
@@ -1532,14 +1949,20 @@ def ensure_company_variant_images(theme: dict) -> list[str]:
     asset_dir = IMAGE_OUTPUT_DIR / "company_variants"
     asset_dir.mkdir(parents=True, exist_ok=True)
 
+    variant_files = [asset_dir / f"{theme_id}-v{i}.svg" for i in range(1, COMPANY_VARIANT_COUNT + 1)]
+    if all(path.exists() for path in variant_files):
+        # Every variant is already rendered; the logo is only needed to draw missing ones.
+        _company_variant_paths_cache[theme_id] = [to_web_path(path) for path in variant_files]
+        _company_variant_source_cache[theme_id] = "generated-logo-variants"
+        return _company_variant_paths_cache[theme_id]
+
     logo_href = fetch_company_logo_data_uri(theme) or get_company_logo_url(theme)
     if not logo_href:
         _company_variant_source_cache[theme_id] = "none"
         return []
 
     paths: list[str] = []
-    for i in range(1, COMPANY_VARIANT_COUNT + 1):
-        path = asset_dir / f"{theme_id}-v{i}.svg"
+    for i, path in enumerate(variant_files, start=1):
         if not path.exists():
             render_company_variant_svg(theme=theme, output_path=path, logo_href=logo_href, variant_index=i)
         paths.append(to_web_path(path))
@@ -1558,44 +1981,38 @@ def pick_company_variant_image(theme: dict, article_uid: str = "", title: str =
     if COMPANY_DAILY_ROTATION:
         day_key = datetime.now().strftime("%Y-%m-%d")
         uid = article_uid or title or day_key
-        seed = hashlib.sha1(f"{theme_id}|{day_key}|{uid}".encode("utf-8")).hexdigest()
-        picked = int(seed[:12], 16) % len(paths)
+        seed = hashlib.sha1(f"{theme_id}|{day_key}|{uid}".encode("utf-8")).digest()
+        picked = int.from_bytes(seed[:6], "big") % len(paths)
     else:
         last_idx = _company_last_variant_index.get(theme_id, -1)
         candidates = list(range(len(paths)))
         if len(candidates) > 1 and last_idx in candidates:
             candidates.remove(last_idx)
-        picked = random.SystemRandom().choice(candidates)
+        picked = _variant_rng.choice(candidates)
         _company_last_variant_index[theme_id] = picked
 
     source = _company_variant_source_cache.get(theme_id, "generated-logo-variants")
     return paths[picked], picked + 1, source
 
 
-def find_keyword_theme(text: str):
-    text_lower = (text or "").lower()
-    best_match = None
-
-    def scan(themes: list[dict], priority: int):
-        nonlocal best_match
-        for theme in themes:
-            for keyword in theme.get("keywords", []):
-                needle = keyword.lower().strip()
-                if not needle:
-                    continue
-                pos = text_lower.find(needle)
-                if pos < 0:
-                    continue
-                # Lower tuple wins: company priority -> earlier mention -> longer keyword.
-                score = (priority, pos, -len(needle))
-                if best_match is None or score < best_match[0]:
-                    best_match = (score, theme, keyword)
-
-    scan(COMPANY_THEMES, priority=0)
-    scan(KEYWORD_THEMES, priority=1)
-    if not best_match:
+def find_keyword_theme(text: str, text_lower: str | None = None):
+    if text_lower is None:
+        text_lower = (text or "").lower()
+    if not text_lower:
         return None, ""
-    return best_match[1], best_match[2]
+
+    # Company needles are scanned first; within a pass the earliest, then longest, mention wins.
+    for pattern in _KEYWORD_THEME_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            _, theme, keyword = _KEYWORD_THEME_INDEX[match.group(0)]
+            return theme, keyword
+    return None, ""
+
+
+@functools.lru_cache(maxsize=4096)
+def find_keyword_theme_cached(text: str):
+    return find_keyword_theme(text)
 
 
 def build_representative_queries(theme: dict, matched_keyword: str) -> list[str]:
@@ -1649,6 +2066,29 @@ def build_keyword_photo_prompt(theme: dict, matched_keyword: str, title: str) ->
     )
 
 
+def save_first_stock_image(url_pool: list[str], output_path: Path) -> bool:
+    """Save the first usable image in url_pool order, fetching a small window of candidates at a time."""
+    if not url_pool:
+        return False
+    # The first candidate usually succeeds; the next window opens only after every fetch in
+    # the current one failed. Results are read in pool order, so the pick stays deterministic,
+    # and leaving the executor block waits for the window's other in-flight downloads.
+    window = min(STOCK_FETCH_WINDOW, len(url_pool))
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        for start in range(0, len(url_pool), window):
+            batch = url_pool[start : start + window]
+            for payload in executor.map(lambda url: fetch_image_payload(url, KEYWORD_STOCK_TIMEOUT), batch):
+                if not payload:
+                    continue
+                # Output files are named per article, so the name identifies the claiming article.
+                if not claim_image_bytes_for_run(payload, owner=output_path.name):
+                    continue
+                output_path.write_bytes(payload)
+                return True
+
+    return False
+
+
 def download_stock_photo_for_keyword(
     theme: dict,
     matched_keyword: str,
@@ -1659,8 +2099,9 @@ def download_stock_photo_for_keyword(
         return False
 
     uid_source = article_uid or f"{theme.get('id','tech')}|{matched_keyword}"
-    uid_hash = hashlib.sha1(uid_source.encode("utf-8")).hexdigest()
-    lock_num = int(uid_hash[:8], 16) % 1_000_000 + 1
+    uid_digest = hashlib.sha1(uid_source.encode("utf-8")).digest()
+    uid_hash = uid_digest.hex()
+    lock_num = int.from_bytes(uid_digest[:4], "big") % 1_000_000 + 1
 
     default_theme_tags = {
         "ai": "technology,computer,data",
@@ -1677,22 +2118,22 @@ def download_stock_photo_for_keyword(
     if not theme_tag_pool:
         theme_tag_pool = [default_theme_tags.get(theme_id, "technology,computer")]
 
-    start_index = int(uid_hash[8:12], 16) % len(theme_tag_pool)
-    ordered_tags = [theme_tag_pool[(start_index + i) % len(theme_tag_pool)] for i in range(len(theme_tag_pool))]
+    start_index = int.from_bytes(uid_digest[4:6], "big") % len(theme_tag_pool)
+    ordered_tags = theme_tag_pool[start_index:] + theme_tag_pool[:start_index]
 
     query_pool = build_representative_queries(theme=theme, matched_keyword=matched_keyword)
     if not query_pool:
         query_pool = [f"{theme_id} technology"]
-    query_start = int(uid_hash[12:16], 16) % len(query_pool)
-    ordered_queries = [query_pool[(query_start + i) % len(query_pool)] for i in range(len(query_pool))]
+    query_start = int.from_bytes(uid_digest[6:8], "big") % len(query_pool)
+    ordered_queries = query_pool[query_start:] + query_pool[:query_start]
 
     url_pool: list[str] = []
     if KEYWORD_REPRESENTATIVE_QUERY_ENABLED:
-        sig_base = int(uid_hash[:8], 16) % 10_000
+        sig_base = int.from_bytes(uid_digest[:4], "big") % 10_000
         for i, query in enumerate(ordered_queries[:6]):
             url_pool.append(f"https://source.unsplash.com/1600x900/?{quote_plus(query)}&sig={sig_base + i}")
 
-    keyword_ascii = re.sub(r"[^a-z0-9]+", ",", (matched_keyword or "").lower()).strip(",")
+    keyword_ascii = _KEYWORD_ASCII_RE.sub(",", (matched_keyword or "").lower()).strip(",")
     if keyword_ascii:
         url_pool.append(f"https://loremflickr.com/1600/900/{quote_plus(keyword_ascii)},technology?lock={lock_num}")
 
@@ -1705,16 +2146,32 @@ def download_stock_photo_for_keyword(
     seed = quote_plus(f"{theme_id}-{matched_keyword or 'tech'}-{uid_hash[:10]}")
     url_pool.append(f"https://picsum.photos/seed/{seed}/1600/900")
 
-    for stock_url in url_pool:
-        payload = fetch_image_payload(stock_url, KEYWORD_STOCK_TIMEOUT)
-        if not payload:
-            continue
-        if not claim_image_bytes_for_run(payload):
-            continue
-        output_path.write_bytes(payload)
-        return True
+    return save_first_stock_image(url_pool, output_path)
 
-    return False
+
+KEYWORD_COVER_SVG_TEMPLATE = b"""<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024">
+  <defs>
+    <linearGradient id="kwbg" x1="0" y1="0" x2="1" y2="1">
+      <stop offset="0%%" stop-color="%(c1)s" />
+      <stop offset="60%%" stop-color="%(c2)s" />
+      <stop offset="100%%" stop-color="%(c3)s" />
+    </linearGradient>
+  </defs>
+  <rect width="1024" height="1024" fill="url(#kwbg)" />
+  <g opacity="0.16" fill="none" stroke="white" stroke-width="3">
+    <circle cx="860" cy="200" r="140" />
+    <circle cx="180" cy="860" r="180" />
+    <path d="M140 700 C360 520, 640 860, 900 650" />
+  </g>
+  <rect x="72" y="72" width="250" height="46" rx="23" fill="rgba(255,255,255,0.18)" />
+  <text x="94" y="103" fill="white" font-size="24" font-family="Arial, sans-serif" font-weight="700">%(safe_source)s</text>
+  <rect x="76" y="136" width="220" height="38" rx="19" fill="rgba(255,255,255,0.12)" />
+  <text x="94" y="162" fill="#e2e8f0" font-size="20" font-family="Arial, sans-serif">%(key_text)s</text>
+  <text x="80" y="560" fill="white" font-size="112" font-family="Arial, sans-serif" font-weight="800">%(label)s</text>
+  <text x="82" y="610" fill="#dbeafe" font-size="32" font-family="Arial, sans-serif">%(subtitle)s</text>
+  <text x="80" y="892" fill="#f8fafc" font-size="34" font-family="Arial, sans-serif">%(safe_title)s</text>
+</svg>
+"""
 
 
 def render_keyword_svg_cover(
@@ -1731,30 +2188,24 @@ def render_keyword_svg_cover(
     safe_title = html.escape(title[:52] + ("..." if len(title) > 52 else ""))
     key_text = html.escape(matched_keyword[:24])
 
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024">
-  <defs>
-    <linearGradient id="kwbg" x1="0" y1="0" x2="1" y2="1">
-      <stop offset="0%" stop-color="{c1}" />
-      <stop offset="60%" stop-color="{c2}" />
-      <stop offset="100%" stop-color="{c3}" />
-    </linearGradient>
-  </defs>
-  <rect width="1024" height="1024" fill="url(#kwbg)" />
-  <g opacity="0.16" fill="none" stroke="white" stroke-width="3">
-    <circle cx="860" cy="200" r="140" />
-    <circle cx="180" cy="860" r="180" />
-    <path d="M140 700 C360 520, 640 860, 900 650" />
-  </g>
-  <rect x="72" y="72" width="250" height="46" rx="23" fill="rgba(255,255,255,0.18)" />
-  <text x="94" y="103" fill="white" font-size="24" font-family="Arial, sans-serif" font-weight="700">{safe_source}</text>
-  <rect x="76" y="136" width="220" height="38" rx="19" fill="rgba(255,255,255,0.12)" />
-  <text x="94" y="162" fill="#e2e8f0" font-size="20" font-family="Arial, sans-serif">{key_text}</text>
-  <text x="80" y="560" fill="white" font-size="112" font-family="Arial, sans-serif" font-weight="800">{label}</text>
-  <text x="82" y="610" fill="#dbeafe" font-size="32" font-family="Arial, sans-serif">{subtitle}</text>
-  <text x="80" y="892" fill="#f8fafc" font-size="34" font-family="Arial, sans-serif">{safe_title}</text>
-</svg>
-"""
-    output_path.write_text(svg, encoding="utf-8")
+    svg = KEYWORD_COVER_SVG_TEMPLATE % {
+        b"c1": c1.encode("utf-8"),
+        b"c2": c2.encode("utf-8"),
+        b"c3": c3.encode("utf-8"),
+        b"safe_source": safe_source.encode("utf-8"),
+        b"key_text": key_text.encode("utf-8"),
+        b"label": label.encode("utf-8"),
+        b"subtitle": subtitle.encode("utf-8"),
+        b"safe_title": safe_title.encode("utf-8"),
+    }
+    output_path.write_bytes(svg)
+
+
+# Fixed tail of the generic query pool with its de-dup keys, normalized once at import.
+_GENERIC_STOCK_QUERY_POOL = tuple(
+    (query, normalize_space(query).lower())
+    for query in ("technology startup office", "computer innovation workspace")
+)
 
 
 def download_generic_stock_photo(title: str, source: str, article_uid: str, output_path: Path) -> bool:
@@ -1762,24 +2213,19 @@ def download_generic_stock_photo(title: str, source: str, article_uid: str, outp
         return False
 
     uid_source = article_uid or f"{source}|{title}"
-    uid_hash = hashlib.sha1(uid_source.encode("utf-8")).hexdigest()
-    lock_num = int(uid_hash[:8], 16) % 1_000_000 + 1
-
-    ascii_terms = re.findall(r"[a-zA-Z][a-zA-Z0-9]{2,}", f"{title} {source}".lower())
-    noisy = {"the", "and", "for", "with", "from", "news", "tech", "today"}
-    token = next((x for x in ascii_terms if x not in noisy), "technology")
-
-    query_pool = [
-        f"{token} technology",
-        f"{source} technology",
-        "technology startup office",
-        "computer innovation workspace",
-    ]
+    uid_digest = hashlib.sha1(uid_source.encode("utf-8")).digest()
+    uid_hash = uid_digest.hex()
+    lock_num = int.from_bytes(uid_digest[:4], "big") % 1_000_000 + 1
+
+    ascii_terms = _WORD_TOKEN_RE.findall(f"{title} {source}".lower())
+    token = next((x for x in ascii_terms if x not in _NOISY_QUERY_TERMS), "technology")
+
+    query_pool = [(query, normalize_space(query).lower()) for query in (f"{token} technology", f"{source} technology")]
+    query_pool.extend(_GENERIC_STOCK_QUERY_POOL)
     # Stable de-dup preserving order.
     ordered_unique_queries: list[str] = []
     seen_queries: set[str] = set()
-    for query in query_pool:
-        q = normalize_space(query).lower()
+    for query, q in query_pool:
         if not q or q in seen_queries:
             continue
         seen_queries.add(q)
@@ -1787,12 +2233,9 @@ def download_generic_stock_photo(title: str, source: str, article_uid: str, outp
 
     url_pool: list[str] = []
     if KEYWORD_REPRESENTATIVE_QUERY_ENABLED and ordered_unique_queries:
-        query_start = int(uid_hash[12:16], 16) % len(ordered_unique_queries)
-        sig_base = int(uid_hash[:8], 16) % 10_000
-        ordered_queries = [
-            ordered_unique_queries[(query_start + i) % len(ordered_unique_queries)]
-            for i in range(len(ordered_unique_queries))
-        ]
+        query_start = int.from_bytes(uid_digest[6:8], "big") % len(ordered_unique_queries)
+        sig_base = int.from_bytes(uid_digest[:4], "big") % 10_000
+        ordered_queries = ordered_unique_queries[query_start:] + ordered_unique_queries[:query_start]
         for i, query in enumerate(ordered_queries[:4]):
             url_pool.append(f"https://source.unsplash.com/1600x900/?{quote_plus(query)}&sig={sig_base + i}")
 
@@ -1804,16 +2247,7 @@ def download_generic_stock_photo(title: str, source: str, article_uid: str, outp
         ]
     )
 
-    for stock_url in url_pool:
-        payload = fetch_image_payload(stock_url, KEYWORD_STOCK_TIMEOUT)
-        if not payload:
-            continue
-        if not claim_image_bytes_for_run(payload):
-            continue
-        output_path.write_bytes(payload)
-        return True
-
-    return False
+    return save_first_stock_image(url_pool, output_path)
 
 
 def build_fallback_prompt(title: str, source: str) -> str:
@@ -1831,13 +2265,25 @@ def build_fallback_summary(title: str, original_content: str) -> str:
     return text
 
 
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*({[\s\S]*?})\s*```", re.IGNORECASE)
+_FENCED_JSON_ARRAY_RE = re.compile(r"```(?:json)?\s*(\[[\s\S]*?\])\s*```", re.IGNORECASE)
+
+
 def parse_json_from_response_text(text: str) -> dict:
     if not text:
         return {}
     raw = text.strip()
 
+    # Common case: the reply is a bare JSON object, so skip the fence search and brace slicing.
+    if raw[:1] == "{" and raw[-1:] == "}" and "```" not in raw:
+        try:
+            parsed = json.loads(raw)
+            return parsed if isinstance(parsed, dict) else {}
+        except Exception:
+            return {}
+
     # Prefer fenced JSON if model returned markdown.
-    fenced = re.search(r"```(?:json)?\s*({[\s\S]*?})\s*```", raw, re.IGNORECASE)
+    fenced = _FENCED_JSON_RE.search(raw)
     if fenced:
         raw = fenced.group(1).strip()
     else:
@@ -1853,12 +2299,58 @@ def parse_json_from_response_text(text: str) -> dict:
         return {}
 
 
+def parse_json_array_from_response_text(text: str) -> list:
+    if not text:
+        return []
+    raw = text.strip()
+
+    fenced = _FENCED_JSON_ARRAY_RE.search(raw)
+    if fenced:
+        raw = fenced.group(1).strip()
+    else:
+        start = raw.find("[")
+        end = raw.rfind("]")
+        if start >= 0 and end > start:
+            raw = raw[start : end + 1]
+
+    try:
+        parsed = json.loads(raw)
+        return parsed if isinstance(parsed, list) else []
+    except Exception:
+        return []
+
+
+def loads_json(content: bytes):
+    # orjson parses UTF-8 bytes directly, without decoding to str first.
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def load_json(path: Path):
+    return loads_json(path.read_bytes())
+
+
+def dumps_json(obj) -> bytes:
+    return dumps_news_json(obj)
+
+
+def dump_json(obj, path: Path):
+    path.write_bytes(dumps_json(obj))
+
+
 def get_latest_gemini_model() -> str:
     """사용 가능한 최신 Gemini 3 flash 계열 모델명을 탐색합니다."""
+    global _latest_gemini_model
+
     fallback = "gemini-1.5-flash"
     if genai is None or not GEMINI_API_KEY:
         return fallback
+    # list_models() is a network round trip; resolve once per process.
+    if _latest_gemini_model is not None:
+        return _latest_gemini_model
 
+    _latest_gemini_model = fallback
     try:
         matched: list[str] = []
         for m in genai.list_models():
@@ -1869,11 +2361,15 @@ def get_latest_gemini_model() -> str:
             if "gemini-3-flash" in name:
                 matched.append(name)
         if matched:
-            return sorted(matched)[-1]
+            _latest_gemini_model = max(matched)
     except Exception as e:
         print(f"[WARN] Failed to list Gemini models: {e}")
 
-    return fallback
+    return _latest_gemini_model
+
+
+def get_gemini_curation_model_name() -> str:
+    return os.getenv("GEMINI_CURATION_MODEL", "").strip() or get_latest_gemini_model()
 
 
 def get_gemini_text_model():
@@ -1885,7 +2381,7 @@ def get_gemini_text_model():
     if _gemini_text_model is not None:
         return _gemini_text_model
 
-    model_name = os.getenv("GEMINI_CURATION_MODEL", "").strip() or get_latest_gemini_model()
+    model_name = get_gemini_curation_model_name()
     try:
         _gemini_text_model = genai.GenerativeModel(model_name)
         _gemini_text_model_name = model_name
@@ -1895,6 +2391,44 @@ def get_gemini_text_model():
         return None
 
 
+def save_curation_cache():
+    if not _curation_cache:
+        return
+    try:
+        CURATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CURATION_CACHE_PATH.with_suffix(".tmp")
+        dump_json(_curation_cache, tmp_path)
+        os.replace(tmp_path, CURATION_CACHE_PATH)
+    except Exception as e:
+        print(f"[WARN] Failed to save curation cache: {e}")
+
+
+def get_curation_cache() -> dict[str, dict]:
+    """Load the on-disk curation cache once, dropping expired entries; saved again at exit."""
+    global _curation_cache
+
+    if _curation_cache is not None:
+        return _curation_cache
+    _curation_cache = {}
+    try:
+        if CURATION_CACHE_PATH.exists():
+            cutoff = datetime.now().timestamp() - CURATION_CACHE_TTL_SECONDS
+            _curation_cache = {
+                key: entry
+                for key, entry in load_json(CURATION_CACHE_PATH).items()
+                if entry.get("at", 0) >= cutoff
+            }
+    except Exception as e:
+        print(f"[WARN] Failed to load curation cache: {e}")
+    atexit.register(save_curation_cache)
+    return _curation_cache
+
+
+def build_curation_cache_key(title: str, original_content: str, source: str) -> str:
+    raw = f"{title}|{original_content[:2000]}|{source}|{_gemini_text_model_name}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def recreate_news_content(title: str, original_content: str, source: str) -> dict:
     """
     뉴스 요약 재창작 + 이미지 프롬프트를 동시에 생성합니다.
@@ -1913,6 +2447,22 @@ def recreate_news_content(title: str, original_content: str, source: str) -> dic
             "mode": "curation-disabled",
         }
 
+    model = get_gemini_text_model()
+
+    # Cache hits are looked up before the limit check: they cost no Gemini call,
+    # so they must not be dropped once the run's curation budget is spent.
+    cache_key = ""
+    if model is not None and CURATION_CACHE_ENABLED:
+        cache_key = build_curation_cache_key(title, original_content, source)
+        cached = get_curation_cache().get(cache_key)
+        if cached:
+            return {
+                "summary": cached["summary"],
+                "image_prompt": cached["image_prompt"],
+                "model": _gemini_text_model_name,
+                "mode": "curation-cache-hit",
+            }
+
     if NEWS_CURATION_LIMIT > 0 and _curation_count >= NEWS_CURATION_LIMIT:
         return {
             "summary": fallback_summary,
@@ -1921,7 +2471,6 @@ def recreate_news_content(title: str, original_content: str, source: str) -> dic
             "mode": "curation-limit-reached",
         }
 
-    model = get_gemini_text_model()
     if model is None:
         return {
             "summary": fallback_summary,
@@ -1960,12 +2509,20 @@ def recreate_news_content(title: str, original_content: str, source: str) -> dic
 
         curated_summary = normalize_space(payload.get("curated_summary", ""))
         image_prompt = normalize_space(payload.get("image_prompt", ""))
+        summary_from_model = bool(curated_summary)
         if not curated_summary:
             curated_summary = fallback_summary
         if not image_prompt:
             image_prompt = fallback_prompt
 
         _curation_count += 1
+        # Only summaries Gemini actually wrote are cached; an unparseable reply is retried next run.
+        if cache_key and summary_from_model:
+            get_curation_cache()[cache_key] = {
+                "summary": curated_summary,
+                "image_prompt": image_prompt,
+                "at": datetime.now().timestamp(),
+            }
         return {
             "summary": curated_summary,
             "image_prompt": image_prompt,
@@ -1982,6 +2539,102 @@ def recreate_news_content(title: str, original_content: str, source: str) -> dic
         }
 
 
+def curate_news_batch_with_gemini(model, articles: list[tuple[str, str, str]]) -> dict[int, dict]:
+    """One generate_content call for several articles; returns {input index: payload} for usable entries."""
+    entries = [
+        {"idx": idx, "source": source, "title": title, "content": original_content}
+        for idx, (title, original_content, source) in enumerate(articles)
+    ]
+    prompt = f"""
+당신은 IT/AI/로봇 전문 콘텐츠 에디터입니다.
+아래 JSON 배열의 뉴스 각각에 대해 두 항목을 생성하세요.
+
+1) curated_summary
+- 원문 문장을 그대로 복사하지 말고, 완전히 재창작한 한국어 요약 2~3문장
+- 비전공자도 이해 가능한 쉬운 표현
+
+2) image_prompt
+- 기사 원문 사진을 대체할 수 있는 미래지향적 3D 렌더링 스타일의 영어 프롬프트 1개
+- 로고/워터마크/텍스트 오버레이 금지
+
+반드시 입력과 같은 idx를 가진 JSON 배열만 반환:
+[
+  {{"idx": 0, "curated_summary": "...", "image_prompt": "..."}}
+]
+
+[뉴스 목록]
+{json.dumps(entries, ensure_ascii=False)}
+"""
+
+    try:
+        response = model.generate_content(prompt)
+        payloads = parse_json_array_from_response_text(getattr(response, "text", ""))
+    except Exception as e:
+        print(f"[WARN] curate_news_batch_with_gemini failed: {e}")
+        return {}
+
+    by_idx: dict[int, dict] = {}
+    for payload in payloads:
+        if not isinstance(payload, dict):
+            continue
+        idx = payload.get("idx")
+        if isinstance(idx, int) and 0 <= idx < len(articles) and payload.get("curated_summary"):
+            by_idx.setdefault(idx, payload)
+    return by_idx
+
+
+def recreate_news_batch(articles: list[tuple[str, str, str]]) -> list[dict]:
+    """
+    recreate_news_content for many (title, original_content, source) articles, in input order.
+    Uncached articles within the curation limit share one Gemini call per CURATION_BATCH_SIZE;
+    anything a batch reply misses falls back to the per-article call.
+    """
+    global _curation_count
+
+    results: list[dict | None] = [None] * len(articles)
+    model = get_gemini_text_model() if NEWS_CURATION_ENABLED and CURATION_BATCH_SIZE > 1 else None
+    if model is not None:
+        pending: list[int] = []
+        budget = NEWS_CURATION_LIMIT - _curation_count if NEWS_CURATION_LIMIT > 0 else len(articles)
+        for idx, (title, original_content, source) in enumerate(articles):
+            if len(pending) >= budget:
+                break
+            if CURATION_CACHE_ENABLED and build_curation_cache_key(title, original_content, source) in get_curation_cache():
+                continue
+            pending.append(idx)
+
+        for start in range(0, len(pending), CURATION_BATCH_SIZE):
+            batch = pending[start : start + CURATION_BATCH_SIZE]
+            if len(batch) < 2:
+                break
+            replies = curate_news_batch_with_gemini(model, [articles[idx] for idx in batch])
+            for pos, payload in replies.items():
+                idx = batch[pos]
+                title, original_content, source = articles[idx]
+                curated_summary = normalize_space(payload.get("curated_summary", ""))
+                image_prompt = normalize_space(payload.get("image_prompt", "")) or build_fallback_prompt(title, source)
+                if not curated_summary:
+                    continue
+                _curation_count += 1
+                if CURATION_CACHE_ENABLED:
+                    get_curation_cache()[build_curation_cache_key(title, original_content, source)] = {
+                        "summary": curated_summary,
+                        "image_prompt": image_prompt,
+                        "at": datetime.now().timestamp(),
+                    }
+                results[idx] = {
+                    "summary": curated_summary,
+                    "image_prompt": image_prompt,
+                    "model": _gemini_text_model_name,
+                    "mode": "curation-success",
+                }
+
+    for idx, result in enumerate(results):
+        if result is None:
+            results[idx] = recreate_news_content(*articles[idx])
+    return results
+
+
 def extract_text_from_gemini_response(data: dict) -> str:
     for candidate in data.get("candidates", []):
         content = candidate.get("content", {})
@@ -1992,26 +2645,45 @@ def extract_text_from_gemini_response(data: dict) -> str:
     return ""
 
 
+def extract_image_data_from_gemini_response(data: dict) -> str:
+    for candidate in data.get("candidates", []):
+        content = candidate.get("content", {})
+        for part in content.get("parts", []):
+            inline = part.get("inlineData") or {}
+            b64 = inline.get("data")
+            if b64 and inline.get("mimeType", "").startswith("image/"):
+                return b64
+    return ""
+
+
 def generate_prompt_with_gemini(title: str, source: str) -> str:
     fallback = build_fallback_prompt(title, source)
     if not GEMINI_API_KEY:
         return fallback
 
+    cache_key = hashlib.blake2b(f"{GEMINI_PROMPT_MODEL}|{title}|{source}".encode("utf-8"), digest_size=8).digest()
+    cached = _gemini_prompt_cache.get(cache_key)
+    if cached:
+        return cached
+
     try:
-        prompt_task = (
+        # Fixed instructions go in systemInstruction so every request shares the same prefix.
+        system_instruction = (
             "You are a prompt writer for editorial tech cover images.\n"
             "Return exactly one English prompt only.\n"
-            f"News title: {title}\n"
-            f"Source: {source}\n"
             f"Style constraints: {NEWS_IMAGE_STYLE}\n"
             "The prompt must request one clean 3D illustration with no logos or text."
         )
+        prompt_task = f"News title: {title}\nSource: {source}"
 
-        res = requests.post(
+        res = _http_session.post(
             f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_PROMPT_MODEL}:generateContent",
             headers={"Content-Type": "application/json"},
             params={"key": GEMINI_API_KEY},
-            json={"contents": [{"parts": [{"text": prompt_task}]}]},
+            json={
+                "systemInstruction": {"parts": [{"text": system_instruction}]},
+                "contents": [{"parts": [{"text": prompt_task}]}],
+            },
             timeout=25,
         )
         if not res.ok:
@@ -2019,6 +2691,8 @@ def generate_prompt_with_gemini(title: str, source: str) -> str:
             return fallback
 
         prompt = extract_text_from_gemini_response(res.json())
+        if prompt:
+            _gemini_prompt_cache[cache_key] = prompt
         return prompt or fallback
     except Exception as e:
         print(f"[WARN] Gemini prompt generation error: {e}")
@@ -2030,7 +2704,7 @@ def generate_image_with_gemini(prompt: str, output_path: Path) -> bool:
         return False
 
     try:
-        res = requests.post(
+        res = _http_session.post(
             f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_IMAGE_MODEL}:generateContent",
             headers={"Content-Type": "application/json"},
             params={"key": GEMINI_API_KEY},
@@ -2044,53 +2718,45 @@ def generate_image_with_gemini(prompt: str, output_path: Path) -> bool:
             print(f"[WARN] Gemini image generation failed: {res.status_code}")
             return False
 
-        data = res.json()
-        for candidate in data.get("candidates", []):
-            content = candidate.get("content", {})
-            for part in content.get("parts", []):
-                inline = part.get("inlineData") or {}
-                b64 = inline.get("data")
-                mime = inline.get("mimeType", "")
-                if b64 and mime.startswith("image/"):
-                    output_path.write_bytes(base64.b64decode(b64))
-                    return True
-
-        return False
+        # Image replies are several MB of base64; parse the raw bytes and drop each
+        # intermediate (body, parsed tree) as soon as the next form exists.
+        data = loads_json(res.content)
+        del res
+        b64 = extract_image_data_from_gemini_response(data)
+        del data
+        if not b64:
+            return False
+        payload = base64.b64decode(b64)
+        del b64
+        output_path.write_bytes(payload)
+        return True
     except Exception as e:
         print(f"[WARN] Gemini image generation error: {e}")
         return False
 
 
-def render_local_svg_cover(title: str, source: str, output_path: Path, theme_id: str = ""):
-    palette_by_theme = {
-        "ai": ("#0b1020", "#1d4ed8", "#22d3ee"),
-        "security": ("#111827", "#1f2937", "#0ea5e9"),
-        "semiconductor": ("#1f1b4b", "#4338ca", "#a78bfa"),
-        "mobile": ("#082f49", "#0369a1", "#67e8f9"),
-        "cloud": ("#0f172a", "#334155", "#38bdf8"),
-        "robotics": ("#052e2b", "#0f766e", "#2dd4bf"),
-        "gaming": ("#1f1147", "#6d28d9", "#a78bfa"),
-        "space": ("#0b1020", "#1e3a8a", "#60a5fa"),
-        "general": ("#0f172a", "#1e40af", "#38bdf8"),
-    }
-    base_palette = palette_by_theme.get((theme_id or "").lower(), palette_by_theme["general"])
-    # Keep per-article variety while staying in the selected theme palette.
-    hue_shift = int(hashlib.sha1(title.encode("utf-8")).hexdigest(), 16) % 2
-    if hue_shift == 0:
-        p1, p2, p3 = base_palette
-    else:
-        p1, p2, p3 = (base_palette[1], base_palette[2], base_palette[0])
+SIMPLE_COVER_PALETTES = {
+    "ai": (b"#0b1020", b"#1d4ed8", b"#22d3ee"),
+    "security": (b"#111827", b"#1f2937", b"#0ea5e9"),
+    "semiconductor": (b"#1f1b4b", b"#4338ca", b"#a78bfa"),
+    "mobile": (b"#082f49", b"#0369a1", b"#67e8f9"),
+    "cloud": (b"#0f172a", b"#334155", b"#38bdf8"),
+    "robotics": (b"#052e2b", b"#0f766e", b"#2dd4bf"),
+    "gaming": (b"#1f1147", b"#6d28d9", b"#a78bfa"),
+    "space": (b"#0b1020", b"#1e3a8a", b"#60a5fa"),
+    "general": (b"#0f172a", b"#1e40af", b"#38bdf8"),
+}
 
-    svg = f"""<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024">
+SIMPLE_COVER_SVG_TEMPLATE = b"""<svg xmlns="http://www.w3.org/2000/svg" width="1024" height="1024" viewBox="0 0 1024 1024">
   <defs>
     <linearGradient id="bg" x1="0" y1="0" x2="1" y2="1">
-      <stop offset="0%" stop-color="{p1}" />
-      <stop offset="60%" stop-color="{p2}" />
-      <stop offset="100%" stop-color="{p3}" />
+      <stop offset="0%%" stop-color="%s" />
+      <stop offset="60%%" stop-color="%s" />
+      <stop offset="100%%" stop-color="%s" />
     </linearGradient>
     <radialGradient id="glow" cx="0.8" cy="0.2" r="0.7">
-      <stop offset="0%" stop-color="rgba(255,255,255,0.25)" />
-      <stop offset="100%" stop-color="rgba(255,255,255,0)" />
+      <stop offset="0%%" stop-color="rgba(255,255,255,0.25)" />
+      <stop offset="100%%" stop-color="rgba(255,255,255,0)" />
     </radialGradient>
   </defs>
   <rect width="1024" height="1024" fill="url(#bg)" />
@@ -2107,7 +2773,19 @@ def render_local_svg_cover(title: str, source: str, output_path: Path, theme_id:
   </g>
 </svg>
 """
-    output_path.write_text(svg, encoding="utf-8")
+
+
+def render_local_svg_cover(title: str, source: str, output_path: Path, theme_id: str = ""):
+    base_palette = SIMPLE_COVER_PALETTES.get((theme_id or "").lower(), SIMPLE_COVER_PALETTES["general"])
+    # Keep per-article variety while staying in the selected theme palette.
+    # crc32 is deterministic across runs and far cheaper than a cryptographic digest for one bit.
+    hue_shift = zlib.crc32(title.encode("utf-8")) & 1
+    if hue_shift == 0:
+        palette = base_palette
+    else:
+        palette = (base_palette[1], base_palette[2], base_palette[0])
+
+    output_path.write_bytes(SIMPLE_COVER_SVG_TEMPLATE % palette)
 
 
 def generate_reference_image(
@@ -2118,10 +2796,10 @@ def generate_reference_image(
     context_text: str = "",
 ):
     uid = article_uid or f"{source}|{title}"
-    digest = hashlib.sha1(f"{source}|{title}|{uid}".encode("utf-8")).hexdigest()[:12]
-    stem = f"{slugify(title)}-{digest}"
-    company_theme, company_keyword = find_company_theme_in_title(title)
-    if COMPANY_LOGO_PRIORITY_MODE and company_theme:
+    company_theme, company_keyword = (
+        find_company_theme_cached(title or "") if COMPANY_LOGO_PRIORITY_MODE else (None, "")
+    )
+    if company_theme:
         variant_image, variant_no, variant_source = pick_company_variant_image(
             company_theme, article_uid=uid, title=title
         )
@@ -2140,18 +2818,28 @@ def generate_reference_image(
             prompt = f"company-logo:{company_theme.get('id')}:{company_keyword}"
             return logo_url, prompt, "company-logo"
 
-    search_text = f"{title} {context_text}".strip()
-    theme, matched_keyword = find_keyword_theme(search_text)
+    if context_text and context_text.strip():
+        theme, matched_keyword = find_keyword_theme_cached(f"{title} {context_text}".strip())
+    else:
+        theme, matched_keyword = find_keyword_theme_cached((title or "").strip())
     theme_id = (theme or {}).get("id", "general")
 
-    simple_svg_path = IMAGE_OUTPUT_DIR / f"{stem}-simple.svg"
-    if not simple_svg_path.exists():
-        render_local_svg_cover(
-            title=f"{theme_id}|{title}",
-            source=source,
-            output_path=simple_svg_path,
-            theme_id=theme_id,
-        )
+    # Only the simple-cover path needs a file stem; company-matched articles skip the digest.
+    # SHA-1 stays so existing cover filenames keep matching; digest()[:6].hex() equals hexdigest()[:12].
+    digest = hashlib.sha1(f"{source}|{title}|{uid}".encode("utf-8")).digest()[:6].hex()
+    stem = f"{slugify(title)}-{digest}"
+    simple_svg_name = f"{stem}-simple.svg"
+    simple_svg_path = IMAGE_OUTPUT_DIR / simple_svg_name
+    # Covers checked or drawn earlier in this run skip the stat; only unseen stems hit the disk.
+    if stem not in _rendered_svg_stems:
+        if not simple_svg_path.exists():
+            render_local_svg_cover(
+                title=f"{theme_id}|{title}",
+                source=source,
+                output_path=simple_svg_path,
+                theme_id=theme_id,
+            )
+        _rendered_svg_stems.add(stem)
 
     prompt = f"simple-illustration:{theme_id}:{matched_keyword or 'none'}"
     return to_web_path(simple_svg_path), prompt, "simple-illustration"
@@ -2193,24 +2881,58 @@ def make_record(
         "image_provider": image_provider,
         "curation_model": curation_model,
         "curation_mode": curation_mode,
+        # Internal sort hint; main() strips it before writing the data files.
+        SORT_PRIORITY_KEY: 0 if "openai" in title.lower() or "openai" in media.lower() else 1,
     }
 
 
+def is_openai_item(item: dict) -> bool:
+    """OpenAI-related records sort first; reads either the English or Korean keys."""
+    title = item.get("title") or item.get(KEY_TITLE) or ""
+    if "openai" in title.lower():
+        return True
+    media = item.get("media") or item.get(KEY_MEDIA) or ""
+    return "openai" in media.lower()
+
+
+def get_sort_priority(item: dict) -> int:
+    """0 for OpenAI-related records, else 1; uses the make_record hint when present."""
+    priority = item.get(SORT_PRIORITY_KEY)
+    if priority is None:
+        return 0 if is_openai_item(item) else 1
+    return priority
+
+
+_NAVER_LINK_SLOW_PATH_RE = re.compile(r"/\.|[;:#]|\?$")
+
+
+def resolve_naver_link(link: str) -> str:
+    """Absolutize a Naver href; plain root-relative paths skip the full urljoin parse."""
+    if not link or link.startswith("http"):
+        return link
+    # Plain root-relative paths (no dot segments, params, colons, fragments or empty query)
+    # need no parsing; anything else keeps urljoin's exact normalization.
+    if link[:1] == "/" and link[1:2] != "/" and not _NAVER_LINK_SLOW_PATH_RE.search(link):
+        return NAVER_NEWS_BASE + link
+    return urljoin(NAVER_NEWS_BASE, link)
+
+
 def collect_domestic_news(now: str) -> list[dict]:
     items_out: list[dict] = []
     print("Collecting Domestic News from: Naver IT/Science Section")
 
-    list_url = "https://news.naver.com/section/105"
-    r = requests.get(list_url, headers=REQUEST_HEADERS, timeout=8)
+    list_url = f"{NAVER_NEWS_BASE}/section/105"
+    r = _http_session.get(list_url, timeout=8)
     if r.status_code != 200:
         print(f"[WARN] Failed to fetch Naver IT news list page: {r.status_code}")
         return items_out
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = BeautifulSoup(r.content, "lxml")
     # Change selector to capture the whole item which includes both thumb and text
     news_items = soup.select(".sa_item_inner")[:10]
     print(f"Found {len(news_items)} domestic news items")
 
+    parsed_items = []
     for idx, item in enumerate(news_items, start=1):
         text_area = item.select_one(".sa_text")
         if not text_area:
@@ -2221,9 +2943,7 @@ def collect_domestic_news(now: str) -> list[dict]:
             continue
 
         title = link_elem.get_text(strip=True)
-        link = link_elem.get("href", "").strip()
-        if link and not link.startswith("http"):
-            link = urljoin("https://news.naver.com", link)
+        link = resolve_naver_link(link_elem.get("href", "").strip())
 
         # Extract Thumbnail if available
         image_url = ""
@@ -2242,7 +2962,12 @@ def collect_domestic_news(now: str) -> list[dict]:
 
         summary_elem = text_area.select_one(".sa_text_lede")
         original_content = summary_elem.get_text(strip=True) if summary_elem else title
-        curation = recreate_news_content(title=title, original_content=original_content, source=media_name)
+        parsed_items.append((idx, title, link, image_url, media_name, original_content))
+
+    # Curate the whole page in batched Gemini calls before assigning images.
+    curations = recreate_news_batch([(title, content, media) for _, title, _, _, media, content in parsed_items])
+
+    for (idx, title, link, image_url, media_name, original_content), curation in zip(parsed_items, curations):
         summary = curation["summary"]
         image_prompt = curation["image_prompt"]
 
@@ -2295,26 +3020,56 @@ def collect_domestic_news(now: str) -> list[dict]:
     return items_out
 
 
+HN_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+
+def fetch_hn_item(sid) -> dict | None:
+    item_url = f"https://hacker-news.firebaseio.com/v0/item/{sid}.json"
+    try:
+        ir = _http_session.get(item_url, headers=HN_HEADERS, timeout=3)
+        if ir.status_code != 200:
+            return None
+        return ir.json()
+    except Exception as e:
+        print(f"[WARN] Failed to fetch Hacker News item {sid}: {e}")
+        return None
+
+
+def read_leading_json_ints(res: requests.Response, count: int) -> list[int]:
+    """First `count` entries of a streamed JSON integer array, without downloading the rest."""
+    buf = b""
+    for chunk in res.iter_content(chunk_size=256):
+        buf += chunk
+        # With `count` commas seen, the first `count` numbers are complete.
+        if buf.count(b",") >= count:
+            break
+    body = buf.lstrip()
+    if not body.startswith(b"["):
+        return []
+    tokens = (token.strip(b" \t\r\n]") for token in body[1:].split(b",")[:count])
+    return [int(token) for token in tokens if token]
+
+
 def collect_hacker_news(now: str) -> list[dict]:
     items_out: list[dict] = []
     print("Collecting Global News from: Hacker News (API)")
     
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
     try:
         top_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-        r = requests.get(top_url, headers=headers, timeout=5)
-        if r.status_code != 200:
+        with _http_session.get(top_url, headers=HN_HEADERS, timeout=5, stream=True) as r:
+            if r.status_code != 200:
+                return []
+
+            story_ids = read_leading_json_ints(r, 10)  # Top 10
+
+        if not story_ids:
             return []
-        
-        story_ids = r.json()[:10]  # Top 10
-        
-        for sid in story_ids:
-            item_url = f"https://hacker-news.firebaseio.com/v0/item/{sid}.json"
-            ir = requests.get(item_url, headers=headers, timeout=3)
-            if ir.status_code != 200:
-                continue
-                
-            item = ir.json()
+
+        # Item lookups run concurrently; map() keeps the topstories ranking.
+        with ThreadPoolExecutor(max_workers=min(HN_FETCH_WORKERS, len(story_ids))) as executor:
+            hn_items = list(executor.map(fetch_hn_item, story_ids))
+
+        for sid, item in zip(story_ids, hn_items):
             if not item or item.get('type') != 'story':
                 continue
 
@@ -2353,7 +3108,6 @@ def collect_hacker_news(now: str) -> list[dict]:
                     curation_mode="api-metadata"
                 )
             )
-            time.sleep(0.1)
 
     except Exception as e:
         print(f"[WARN] Failed to collect Hacker News: {e}")
@@ -2375,10 +3129,12 @@ def collect_global_news(now: str) -> list[dict]:
         "Microsoft Research": "https://www.microsoft.com/en-us/research/feed/",
     }
 
-    for source, url in usa_feeds.items():
+    # Network I/O for all feeds runs concurrently; image steps below stay sequential.
+    parsed_feeds = fetch_rss_feeds(usa_feeds, max_items=8)
+
+    for source, parsed in parsed_feeds.items():
         try:
             print(f"Collecting Global News from: {source}")
-            parsed = parse_rss_feed(url, max_items=8)
             feed_items = parsed.get("items", [])
             feed_meta = parsed.get("meta", {})
             feed_allow = feed_explicitly_allows_rss_images(feed_meta)
@@ -2392,22 +3148,24 @@ def collect_global_news(now: str) -> list[dict]:
                 policy_note = "explicit-allow" if feed_allow else "no-explicit-allow"
             print(f"  - RSS image policy: {policy_note}")
 
-            for item in feed_items:
-                title = item.get("title", "")
-                link = item.get("link", "")
-                original_content = item.get("description", "")
-                curation = recreate_news_content(title=title, original_content=original_content, source=source)
+            # One batched curation request per feed instead of one per item.
+            curations = recreate_news_batch([(item.title, item.description, source) for item in feed_items])
+
+            for item, curation in zip(feed_items, curations):
+                title = item.title
+                link = item.link
+                original_content = item.description
                 summary = curation["summary"]
                 image_prompt = curation["image_prompt"]
-                rss_image_url = item.get("rss_image_url", "")
-                item_rights = item.get("item_rights", "")
+                rss_image_url = item.rss_image_url
+                item_rights = item.item_rights
 
                 if USE_RSS_SOURCE_IMAGE and should_use_rss_source_image(
                     source_name=source,
                     rss_image_url=rss_image_url,
                     feed_allows=feed_allow,
                     item_rights=item_rights,
-                ) and claim_remote_image_url_for_run(rss_image_url):
+                ) and claim_remote_image_url_for_run(rss_image_url, owner=link):
                     image_url = rss_image_url
                     prompt = "rss-image-direct-use"
                     provider = "rss-source-image"
@@ -2449,6 +3207,7 @@ def collect_news() -> list[dict]:
     global _company_variant_paths_cache
     global _company_variant_source_cache
     global _company_last_variant_index
+    global _rendered_svg_stems
 
     _used_image_hashes_in_run.clear()
     _used_remote_image_urls_in_run.clear()
@@ -2456,17 +3215,20 @@ def collect_news() -> list[dict]:
     _company_variant_paths_cache.clear()
     _company_variant_source_cache.clear()
     _company_last_variant_index.clear()
+    _rendered_svg_stems.clear()
 
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
     IMAGE_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     COMPANY_IMAGE_POOL_DIR.mkdir(parents=True, exist_ok=True)
+    load_image_dedup_db()
+    load_company_caches()
 
     if not GEMINI_API_KEY:
         print("[INFO] GEMINI_API_KEY not found. Local SVG covers will be generated.")
     else:
         print(f"[INFO] GEMINI_API_KEY detected. AI image cap: {NEWS_AI_IMAGE_LIMIT}")
         if NEWS_CURATION_ENABLED:
-            suggested = os.getenv("GEMINI_CURATION_MODEL", "").strip() or get_latest_gemini_model()
+            suggested = get_gemini_curation_model_name()
             print(
                 f"[INFO] Curation enabled. model={suggested}, "
                 f"limit={NEWS_CURATION_LIMIT if NEWS_CURATION_LIMIT else 'unlimited'}"
@@ -2490,29 +3252,22 @@ def collect_news() -> list[dict]:
     # Sorting & Prioritization
     # - OpenAI 관련 뉴스를 최상단으로 올립니다.
     # -------------------------------------------------------------------------
-    def sort_key(item):
-        # OpenAI 키워드가 제목이나 매체에 있으면 우선순위 0 (가장 높음)
-        # 그 외에는 1
-        title_lower = (item.get(KEY_TITLE) or "").lower()
-        media_lower = (item.get(KEY_MEDIA) or "").lower()
-        
-        if 'openai' in title_lower or 'openai' in media_lower:
-            return 0
-        return 1
-
+    # OpenAI 키워드가 제목이나 매체에 있으면 우선순위 0 (가장 높음), 그 외에는 1
     # Python의 sort는 stable하므로, 기존 순서(최신순/소스순)를 유지하면서 그룹핑됩니다.
-    all_news.sort(key=sort_key)
+    all_news.sort(key=get_sort_priority)
 
     return all_news
 
 
+_COLLECTED_AT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}")
+
+
 def main():
     json_name = "news_data.json"
     existing_items = []
     if Path(json_name).exists():
         try:
-            with open(json_name, "r", encoding="utf-8") as f:
-                existing_items = json.load(f)
+            existing_items = load_json(Path(json_name))
         except Exception as e:
             print(f"[WARN] Failed to load existing {json_name}: {e}")
 
@@ -2525,8 +3280,12 @@ def main():
         collected_at_str = item.get("collected_at") or item.get("수집일시")
         if collected_at_str:
             try:
-                # Format is usually "%Y-%m-%d %H:%M"
-                item_date = datetime.strptime(collected_at_str, "%Y-%m-%d %H:%M")
+                # Format is usually "%Y-%m-%d %H:%M"; fromisoformat parses that shape in C,
+                # strptime still handles (or rejects) anything else exactly as before.
+                if _COLLECTED_AT_RE.fullmatch(collected_at_str):
+                    item_date = datetime.fromisoformat(collected_at_str)
+                else:
+                    item_date = datetime.strptime(collected_at_str, "%Y-%m-%d %H:%M")
                 if item_date >= seven_days_ago:
                     retained_items.append(item)
             except ValueError:
@@ -2537,57 +3296,26 @@ def main():
 
     new_items = collect_news()
     
-    # Combine and Deduplicate by link or title
-    seen_links = set()
-    combined_items = []
-    
-    # Add new items first to ensure they take precedence
-    for item in new_items:
-        link = item.get("link") or item.get("링크")
-        title = item.get("title") or item.get("제목")
-        dedup_key = link if link else title
-        if dedup_key not in seen_links:
-            seen_links.add(dedup_key)
-            combined_items.append(item)
-
-    # Add retained older items second
-    for item in retained_items:
-        link = item.get("link") or item.get("링크")
-        title = item.get("title") or item.get("제목")
-        dedup_key = link if link else title
-        if dedup_key not in seen_links:
-            seen_links.add(dedup_key)
-            combined_items.append(item)
-
-    # Sort combined items (OpenAI priorities, then latest first)
-    def sort_key(item):
-        title_lower = (item.get("title") or item.get("제목") or "").lower()
-        media_lower = (item.get("media") or item.get("매체") or "").lower()
-        collected_at = item.get("collected_at") or item.get("수집일시") or ""
-        
-        is_prioritized = 0 if ('openai' in title_lower or 'openai' in media_lower) else 1
-        # Secondary sort by date descending
-        return (is_prioritized, collected_at)
+    # Combine and Deduplicate by link or title.
+    # New items go first so they take precedence over retained older copies.
+    merged: dict[str, dict] = {}
+    for item in (*new_items, *retained_items):
+        dedup_key = item.get("link") or item.get("링크") or item.get("title") or item.get("제목")
+        merged.setdefault(dedup_key, item)
 
-    combined_items.sort(key=sort_key, reverse=True) # Sort reverse=True so newest is first in each priority group
-    # However we need priority 0 (is_prioritized=0) to be at the top. Since reverse=True, 0 will go to the bottom if we aren't careful.
-    # So let's invert the boolean or priority number.
-    
-    def final_sort_key(item):
-        title_lower = (item.get("title") or item.get("제목") or "").lower()
-        media_lower = (item.get("media") or item.get("매체") or "").lower()
-        collected_at = item.get("collected_at") or item.get("수집일시") or ""
-        
-        # Lower number is better priority.
-        priority = 0 if ('openai' in title_lower or 'openai' in media_lower) else 1
-        return (priority, collected_at)
+    # OpenAI priorities first, then latest first. sorted() projects each record to its
+    # (is_openai, collected_at) key exactly once; a single stable sort with reverse=True
+    # keeps the merge order for ties, matching the former date-then-priority double sort.
+    def sort_key(item):
+        return (get_sort_priority(item) == 0, item.get("collected_at") or item.get("수집일시") or "")
 
-    # To sort by priority ASC, date DESC:
-    combined_items.sort(key=lambda x: x.get("collected_at") or x.get("수집일시") or "", reverse=True)
-    combined_items.sort(key=lambda x: 0 if 'openai' in (x.get("title") or x.get("제목") or "").lower() or 'openai' in (x.get("media") or x.get("매체") or "").lower() else 1)
+    combined_items = sorted(merged.values(), key=sort_key, reverse=True)
+    for item in combined_items:
+        item.pop(SORT_PRIORITY_KEY, None)
 
-    with open(json_name, "w", encoding="utf-8") as f:
-        json.dump(combined_items, f, ensure_ascii=False, indent=2)
+    # Serialized once; the same bytes back both news_data.json and news_data.js.
+    payload = dumps_json(combined_items)
+    Path(json_name).write_bytes(payload)
 
     domestic_count = sum(1 for item in combined_items if (item.get("국가") == "국내" or item.get("country") == "domestic"))
     us_count = sum(1 for item in combined_items if (item.get("국가") == "미국" or item.get("country") == "global"))
@@ -2598,10 +3326,11 @@ def main():
 
     # Also save as .js for local file access (CORS bypass)
     js_name = "news_data.js"
-    js_content = f"window.NEWS_DATA = {json.dumps(combined_items, ensure_ascii=False, indent=2)};"
-    with open(js_name, "w", encoding="utf-8") as f:
-        f.write(js_content)
+    gzip_js = gzip_copy_enabled()
+    write_news_js_payload(payload, js_name, gzip_js)
     print(f"[OK] Wrote to {js_name} (for local browser access)")
+    if gzip_js:
+        print(f"[OK] Wrote to {js_name}.gz (precompressed for static hosting)")
 
 
 if __name__ == "__main__":
@@ -1,26 +1,34 @@
-
 import json
 import os
 
+from news_js_writer import write_news_js_payload
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def main():
     json_path = "news_data.json"
     js_path = "news_data.js"
-    
+
     if not os.path.exists(json_path):
         print(f"Error: {json_path} not found.")
         return
 
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        js_content = f"window.NEWS_DATA = {json.dumps(data, ensure_ascii=False, indent=2)};"
-        
-        with open(js_path, 'w', encoding='utf-8') as f:
-            f.write(js_content)
-            
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+
+        # The JSON text is spliced in as-is; parsing only validates it, nothing is re-serialized.
+        if orjson is not None:
+            orjson.loads(raw)
+        else:
+            json.loads(raw)
+        write_news_js_payload(raw, js_path)
+
         print(f"Successfully converted {json_path} to {js_path}")
-        
+
     except Exception as e:
         print(f"Error converting: {e}")
 
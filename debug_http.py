@@ -0,0 +1,20 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared by the debug scripts: keep-alive connections are pooled per host and
+# transient 429/5xx answers are retried before the final response is reported.
+# No session-wide headers: requests' defaults go out unless a script passes its own.
+session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    ),
+)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
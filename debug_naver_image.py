@@ -1,4 +1,6 @@
-import requests
+from concurrent.futures import ThreadPoolExecutor
+
+from debug_http import session
 
 image_url = "https://lh3.googleusercontent.com/J6_coFbogxhRI9iM864NL_liGXvsQp2AupsKei7z0cNNfDvGUmWUy20nuUhkREQyrpY4bEeIBuc=s0-w300-rw"
 
@@ -11,13 +13,24 @@ variants = [
     image_url.split("=")[0]                           # No params
 ]
 
-for v in variants:
-    print(f"\nTesting Variant: {v}")
+# All variants live on the same host; the shared keep-alive session reuses the TLS connection.
+def probe(v):
     try:
-        r = requests.head(v, timeout=5)
-        print(f"Status: {r.status_code}")
-        if r.status_code == 200:
-            print(f"Content-Length: {r.headers.get('content-length', 'unknown')}")
-            print(f"Content-Type: {r.headers.get('content-type', 'unknown')}")
+        return session.head(v, timeout=5), None
     except Exception as e:
-        print(f"Error: {e}")
+        return None, e
+
+
+# The probes are independent; run them together and report in variant order.
+with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+    results = list(executor.map(probe, variants))
+
+for v, (r, error) in zip(variants, results):
+    print(f"\nTesting Variant: {v}")
+    if error is not None:
+        print(f"Error: {error}")
+        continue
+    print(f"Status: {r.status_code}")
+    if r.status_code == 200:
+        print(f"Content-Length: {r.headers.get('content-length', 'unknown')}")
+        print(f"Content-Type: {r.headers.get('content-type', 'unknown')}")
@@ -1,5 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
+import re
+import sys
+
+from lxml import etree
+
+from debug_http import session
 
 def clean_summary(text):
     return text
@@ -7,68 +11,86 @@ def clean_summary(text):
 def sanitize_url(url):
     return url
 
-def extract_image_from_rss_item(item_soup, description_html: str) -> str:
-    print(f"--- Debug Image Extraction ---")
-    media_content = item_soup.find("media:content")
-    if media_content:
-        print(f"Found media:content: {media_content.get('url')}")
-    
-    media_thumbnail = item_soup.find("media:thumbnail")
-    if media_thumbnail:
-         print(f"Found media:thumbnail: {media_thumbnail.get('url')}")
+NS = {
+    "media": "http://search.yahoo.com/mrss/",
+    "content": "http://purl.org/rss/1.0/modules/content/",
+}
+
+# Compiled once; media:content, media:thumbnail and enclosure come back from one
+# C-level union traversal, in document order.
+XP_MEDIA_URLS = etree.XPath(
+    ".//media:content/@url | .//media:thumbnail/@url | .//enclosure/@url", namespaces=NS
+)
+XP_CONTENT_ENCODED = etree.XPath(".//content:encoded", namespaces=NS)
+XP_ANY_CONTENT = etree.XPath(".//*[local-name()='content']")
+# Description HTML is an escaped/CDATA string; a regex finds the first <img> without building a tree.
+IMG_SRC_RE = re.compile(r"""<img\b[^>]*?\bsrc\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
 
-    enclosure = item_soup.find("enclosure")
-    if enclosure:
-         print(f"Found enclosure: {enclosure.get('url')}")
+
+def first_img_src(fragment: str):
+    match = IMG_SRC_RE.search(fragment) if fragment else None
+    return match.group(1) if match else None
+
+
+def extract_image_from_rss_item(item, description_html: str) -> str:
+    print(f"--- Debug Image Extraction ---")
+    found = ""
+    seen = set()
+    for url in XP_MEDIA_URLS(item):
+        owner = url.getparent()
+        name = etree.QName(owner).localname
+        label = f"{owner.prefix}:{name}" if owner.prefix else name
+        if label not in seen:
+            seen.add(label)
+            print(f"Found {label}: {url}")
+        found = found or str(url)
 
     if description_html:
-        desc_soup = BeautifulSoup(description_html, "html.parser")
-        image_tag = desc_soup.find("img")
-        if image_tag:
-             print(f"Found img in description: {image_tag.get('src')}")
+        image_src = first_img_src(description_html)
+        if image_src:
+             print(f"Found img in description: {image_src}")
+             found = found or image_src
 
     # Check content:encoded
-    content_encoded = item_soup.find("content:encoded") or item_soup.find("content")
+    content_encoded = XP_CONTENT_ENCODED(item) or XP_ANY_CONTENT(item)
     if content_encoded:
         print(f"Found content:encoded tag")
-        content_soup = BeautifulSoup(content_encoded.get_text(), "html.parser")
-        img = content_soup.find("img")
+        img = first_img_src("".join(content_encoded[0].itertext()))
         if img:
-            print(f"Found img in content:encoded: {img.get('src')}")
+            print(f"Found img in content:encoded: {img}")
+            found = found or img
 
-    return ""
+    return found
 
 def test_feed(url):
-    print(f"Testing {url}...")
-    r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
+    # Show progress before the network wait; the rest of the report is block-buffered.
+    print(f"Testing {url}...", flush=True)
+    r = session.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
     try:
-        soup = BeautifulSoup(r.content, "xml")
-    except Exception as e:
+        root = etree.fromstring(r.content)
+    except etree.XMLSyntaxError as e:
         print(f"XML parser failed: {e}")
-        soup = BeautifulSoup(r.content, "html.parser")
-    
-    if not soup.find("item"):
-         soup = BeautifulSoup(r.content, "html.parser")
+        root = etree.fromstring(r.content, etree.XMLParser(recover=True))
     
-    items = soup.find_all("item")[:1]
+    items = root.xpath("//item")[:1] if root is not None else []
     for item in items:
         # Print raw item content to see what's really there
         print(f"--- Raw Item Content (first 1000 chars) ---")
-        print(str(item)[:1000])
+        print(etree.tostring(item, encoding="unicode")[:1000])
         
-        title_tag = item.find("title")
-        title = title_tag.get_text(strip=True) if title_tag else "No Title"
+        title = (item.findtext("title") or "").strip() or "No Title"
         print(f"Item: {title}")
         
         # Print all children tags to see what we have
         print("  Tags found in item:")
-        for child in item.find_all(recursive=False):
-            if child.name:
-                print(f"    - {child.name} (attrs: {child.attrs})")
+        for child in item:
+            if isinstance(child.tag, str):
+                print(f"    - {etree.QName(child).localname} (attrs: {dict(child.attrib)})")
 
-        desc = item.find("description")
-        desc_html = desc.decode_contents() if desc else ""
+        # CDATA descriptions come back as the raw HTML string.
+        desc_html = item.findtext("description") or ""
         extract_image_from_rss_item(item, desc_html)
 
 if __name__ == "__main__":
+    sys.stdout.reconfigure(line_buffering=False)
     test_feed("https://techcrunch.com/feed/")
@@ -1,24 +1,32 @@
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+
+from debug_http import session
+
+# Compiled once; RSS <link> (text) and Atom <link href="..."> both come back as the element.
+XP_FIRST_ITEM = etree.XPath("(//item)[1]")
+XP_ITEM_LINK = etree.XPath("link[1]")
 
 # TechCrunch RSS 피드 테스트
 url = "https://techcrunch.com/feed/"
 headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
 
-r = requests.get(url, headers=headers, timeout=10)
-soup = BeautifulSoup(r.content, 'html.parser')
+r = session.get(url, headers=headers, timeout=10)
+# An XML parser keeps <link> as a normal element; HTML parsers treat it as void and drop its text.
+root = etree.fromstring(r.content, etree.XMLParser(recover=True))
 
 # 첫 번째 아이템 확인
-item = soup.find('item')
-if item:
+items = XP_FIRST_ITEM(root) if root is not None else []
+if items:
+    item = items[0]
     print("=== 첫 번째 아이템 구조 ===")
-    print(item.prettify()[:2000])
-    
+    print(etree.tostring(item, encoding="unicode")[:2000])
+
     print("\n=== Link 태그 상세 분석 ===")
-    link_tag = item.find('link')
-    if link_tag:
-        print(f"Link tag: {link_tag}")
-        print(f"Link tag name: {link_tag.name}")
-        print(f"Link tag attrs: {link_tag.attrs}")
-        print(f"Link tag text: '{link_tag.get_text(strip=True)}'")
+    links = XP_ITEM_LINK(item)
+    if links:
+        link_tag = links[0]
+        print(f"Link tag: {etree.tostring(link_tag, encoding='unicode', with_tail=False)}")
+        print(f"Link tag name: {etree.QName(link_tag).localname}")
+        print(f"Link tag attrs: {dict(link_tag.attrib)}")
+        print(f"Link tag text: '{(link_tag.text or '').strip()}'")
         print(f"Link tag href: '{link_tag.get('href', '')}'")
@@ -0,0 +1,21 @@
+import json
+import mmap
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_news_rows(path="news_data.json") -> list:
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        # orjson parses straight from the page-cached mapping; no bytes copy of the file.
+        # It needs a memoryview: a bare mmap object is not accepted.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
@@ -0,0 +1,49 @@
+import gzip
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JS_PREFIX = b"window.NEWS_DATA = "
+JS_SUFFIX = b";"
+GZIP_LEVEL = 6
+
+
+def gzip_copy_enabled() -> bool:
+    # Read at call time so a .env loaded by the caller is honored.
+    return os.getenv("NEWS_JS_GZIP", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def dumps_news_json(items) -> bytes:
+    # orjson's indented UTF-8 output is byte-identical to json.dumps(ensure_ascii=False, indent=2).
+    if orjson is not None:
+        return orjson.dumps(items, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(items, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_news_js_payload(payload: bytes, path="news_data.js", gzip_copy=None):
+    # Prefix, payload and suffix go straight to the file; no concatenated copy of the payload.
+    with open(path, "wb") as f:
+        f.write(JS_PREFIX)
+        f.write(payload)
+        f.write(JS_SUFFIX)
+
+    if gzip_copy is None:
+        gzip_copy = gzip_copy_enabled()
+    if gzip_copy:
+        # Precompressed sibling for static hosts that serve .gz variants as-is.
+        # mtime=0 and no embedded filename keep the bytes stable across identical runs.
+        with open(f"{path}.gz", "wb") as raw, gzip.GzipFile(
+            filename="", mode="wb", fileobj=raw, compresslevel=GZIP_LEVEL, mtime=0
+        ) as f:
+            f.write(JS_PREFIX)
+            f.write(payload)
+            f.write(JS_SUFFIX)
+
+
+def write_news_js(items, path="news_data.js", gzip_copy=None):
+    write_news_js_payload(dumps_news_json(items), path, gzip_copy)
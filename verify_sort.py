@@ -1,20 +1,42 @@
-import json
+import itertools
 import os
+import sys
+
+from news_data_loader import load_news_rows
+
+
+# Flush the report once at exit rather than per line on an interactive terminal.
+sys.stdout.reconfigure(line_buffering=False)
 
 try:
     if not os.path.exists('news_data.json'):
         print("[ERR] news_data.json not found.")
         exit(1)
 
-    with open('news_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    rows = load_news_rows('news_data.json')
         
-    global_news = [x for x in data if x.get('국가') == '미국' or x.get('country') == 'global']
-    
-    print(f"Total Global News: {len(global_news)}")
+    global_news = (x for x in rows if x.get('국가') == '미국' or x.get('country') == 'global')
+
+    # Only the first ten global rows are kept; the rest are counted and checked
+    # for sources as they stream past, without materializing a filtered list.
+    top_items = list(itertools.islice(global_news, 10))
+
+    required = {'Hacker News', 'OpenAI Blog', 'Google DeepMind', 'Google Research', 'Microsoft Research'}
+    found = set()
+    missing = set(required)
+    global_count = 0
+    for x in itertools.chain(top_items, global_news):
+        global_count += 1
+        # Running difference: source lookups stop once every required source has been seen.
+        if missing:
+            media = x.get('매체') or x.get('media')
+            if media in missing:
+                found.add(media)
+                missing.discard(media)
+
+    print(f"Total Global News: {global_count}")
     
     # OpenAI Top Check
-    top_items = global_news[:10]
     openai_count = 0
     print("\n[Top 10 Global News]")
     for i, item in enumerate(top_items):
@@ -27,19 +49,14 @@ try:
             openai_count += 1
             
     if openai_count > 0:
-        if 'openai' in (global_news[0].get('매체') or "").lower() or 'openai' in (global_news[0].get('제목') or "").lower():
+        if 'openai' in (top_items[0].get('매체') or "").lower() or 'openai' in (top_items[0].get('제목') or "").lower():
              print("\n[PASS] OpenAI news is at the VERY TOP.")
         else:
              print("\n[WARN] OpenAI news found in top 10, but NOT at the very top (or 1st item is not OpenAI).")
     else:
         print("\n[WARN] No OpenAI news found in top 10.")
         
-    # Source Check
-    sources = set(x.get('매체') or x.get('media') for x in global_news)
-    required = {'Hacker News', 'OpenAI Blog', 'Google DeepMind', 'Google Research', 'Microsoft Research'}
-    
-    found = sources.intersection(required)
-    missing = required - sources
+    # Source Check (found/missing were collected in the scan above)
     
     print(f"\nFound Target Sources: {found}")
     if missing: